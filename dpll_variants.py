@@ -12,11 +12,138 @@ from typing import List, Tuple, Optional, Set, Dict, Iterable
 from collections import defaultdict, deque
 from dataclasses import dataclass, field
 import copy
+import heapq
+
+import numpy as np
+
+try:
+    from numba import njit
+    NUMBA_AVAILABLE = True
+except ImportError:
+    NUMBA_AVAILABLE = False
+
+    def njit(*args, **kwargs):
+        """No-op decorator fallback when numba is not installed"""
+        if args and callable(args[0]):
+            return args[0]
+
+        def wrap(func):
+            return func
+        return wrap
+
+
+# --- Flat-array propagation kernels (numba-jitted when available) ---
+#
+# Internally, literals use the MiniSat-style encoding
+#   enc(v)  = 2*v       (positive literal v)
+#   enc(-v) = 2*v + 1   (negative literal -v)
+# so var = lit >> 1, negation = lit ^ 1, sign = lit & 1, and encoded
+# literals directly index the occurrence (and watch) arrays. Signed DIMACS
+# literals exist only at the construction/model boundary.
+# Trail events encode the kind in the low two bits:
+#   0 = variable assigned, 1 = clause sat-count bumped, 2 = clause shrunk
+
+
+@njit(cache=True)
+def _assign_flat(lit, lits, starts, lens, sat_count,
+                 occ_start, occ_items, val, trail, trail_len, num_active):
+    """Assign an encoded literal over the flat clause arrays, recording
+    undo events.
+
+    Returns (conflict_clause, trail_len, num_active) where conflict_clause
+    is the index of a clause emptied by the assignment, or -1.
+    """
+    var = lit >> 1
+    val[var] = 1 + (lit & 1)  # 1 = true, 2 = false
+    trail[trail_len] = var << 2
+    trail_len += 1
+
+    # Clauses containing lit become satisfied
+    for p in range(occ_start[lit], occ_start[lit + 1]):
+        clause_idx = occ_items[p]
+        if sat_count[clause_idx] == 0:
+            num_active -= 1
+        sat_count[clause_idx] += 1
+        trail[trail_len] = (clause_idx << 2) | 1
+        trail_len += 1
+
+    # Clauses containing the negation shrink by one literal
+    conflict_clause = -1
+    neg = lit ^ 1
+    for p in range(occ_start[neg], occ_start[neg + 1]):
+        clause_idx = occ_items[p]
+        start = starts[clause_idx]
+        n = lens[clause_idx]
+        for k in range(start, start + n):
+            if lits[k] == neg:
+                lits[k] = lits[start + n - 1]
+                lits[start + n - 1] = neg
+                break
+        lens[clause_idx] = n - 1
+        trail[trail_len] = (clause_idx << 2) | 2
+        trail_len += 1
+        if n == 1 and sat_count[clause_idx] == 0:
+            conflict_clause = clause_idx
+
+    return conflict_clause, trail_len, num_active
+
 
+@njit(cache=True)
+def _propagate_flat(num_clauses, lits, starts, lens, sat_count,
+                    occ_start, occ_items, val, trail, trail_len, num_active):
+    """Scan-based unit propagation over the flat clause arrays.
 
-@dataclass
+    Returns (conflict_clause, trail_len, num_active, propagations) where
+    conflict_clause is the index of an emptied active clause, or -1.
+    """
+    propagations = 0
+    changed = True
+    while changed:
+        changed = False
+        for clause_idx in range(num_clauses):
+            if sat_count[clause_idx] != 0:
+                continue
+            n = lens[clause_idx]
+            if n == 0:
+                return clause_idx, trail_len, num_active, propagations
+            if n == 1:
+                lit = lits[starts[clause_idx]]
+                conflict_clause, trail_len, num_active = _assign_flat(
+                    lit, lits, starts, lens, sat_count,
+                    occ_start, occ_items, val, trail, trail_len, num_active)
+                propagations += 1
+                if conflict_clause >= 0:
+                    return conflict_clause, trail_len, num_active, propagations
+                changed = True
+    return -1, trail_len, num_active, propagations
+
+
+@njit(cache=True)
+def _undo_flat(mark, lens, sat_count, val, trail, trail_len, num_active):
+    """Pop and invert trail events until the trail has length mark"""
+    while trail_len > mark:
+        trail_len -= 1
+        event = trail[trail_len]
+        kind = event & 3
+        idx = event >> 2
+        if kind == 0:
+            val[idx] = 0
+        elif kind == 1:
+            sat_count[idx] -= 1
+            if sat_count[idx] == 0:
+                num_active += 1
+        else:
+            lens[idx] += 1
+    return num_active
+
+
+@dataclass(slots=True)
 class SolverMetrics:
-    """Tracks solver performance metrics"""
+    """Tracks solver performance metrics.
+
+    slots=True gives fixed-offset attribute storage, so the counter
+    bumps on the hot solver paths skip the per-instance __dict__.
+    """
     decisions: int = 0
     backtracks: int = 0
     unit_propagations: int = 0
@@ -32,330 +159,652 @@ class SolverMetrics:
 class BaseDPLL:
     """
     Baseline DPLL implementation
-    - Naive unit propagation (checks all clauses)
-    - Simple data structures
+    - Naive unit propagation (scans all active clauses)
+    - Flat clause storage mutated in place, with an undo trail
     - Basic DLIS heuristic
     """
 
     def __init__(self, clauses: Iterable[Iterable[int]], num_vars: int):
         self.num_vars = num_vars
-        self.clauses = [list(c) for c in clauses]
         self.metrics = SolverMetrics()
         self.assignment = {}  # var -> True/False
 
+        # Flat clause storage: clause i is lits[starts[i]:starts[i]+lens[i]],
+        # with literals in the encoded 2v / 2v+1 form. Removing a literal
+        # swaps it past the end of the slice and shrinks the length, so
+        # backtracking only has to restore the length. Arrays are sized
+        # exactly up front and filled in a single streaming pass, with no
+        # intermediate list-of-lists copy of the clause database.
+        clause_list = list(clauses)  # the iterable may be single-shot
+        self.num_clauses = len(clause_list)
+        total_lits = 0
+        for clause in clause_list:
+            total_lits += len(clause)
+
+        lits = np.empty(total_lits, dtype=np.int32)
+        starts = np.empty(self.num_clauses + 1, dtype=np.int32)
+        lens = np.empty(self.num_clauses, dtype=np.int32)
+        # Occurrence counts land at enc+1 so the cumulative sum below turns
+        # this directly into CSR slice starts
+        occ_start = np.zeros(2 * num_vars + 3, dtype=np.int32)
+
+        pos = 0
+        for clause_idx, clause in enumerate(clause_list):
+            starts[clause_idx] = pos
+            for lit in clause:
+                enc = (lit << 1) if lit > 0 else ((-lit << 1) | 1)
+                lits[pos] = enc
+                occ_start[enc + 1] += 1
+                pos += 1
+            lens[clause_idx] = pos - starts[clause_idx]
+        starts[self.num_clauses] = pos
+
+        self.lits = lits
+        self.starts = starts
+        self.lens = lens
+
+        # CSR occurrence lists indexed directly by encoded literal:
+        # clause ids for literal enc are occ_items[occ_start[enc]:occ_start[enc+1]]
+        np.cumsum(occ_start, out=occ_start)
+        occ_items = np.empty(total_lits, dtype=np.int32)
+        next_slot = occ_start.copy()  # per-literal write cursors
+        for clause_idx in range(self.num_clauses):
+            for k in range(starts[clause_idx], starts[clause_idx + 1]):
+                enc = lits[k]
+                occ_items[next_slot[enc]] = clause_idx
+                next_slot[enc] += 1
+        self.occ_start = occ_start
+        self.occ_items = occ_items
+
+        # Static position -> clause map and position indices, used to
+        # vectorize the pure-literal scan with np.bincount
+        self.lit_clause = np.repeat(
+            np.arange(self.num_clauses, dtype=np.int32), lens)
+        self.lit_pos = np.arange(total_lits, dtype=np.int32)
+
+        # sat_count[i] > 0 means clause i is satisfied under the current
+        # partial assignment; num_active counts clauses with sat_count == 0
+        self.sat_count = np.zeros(self.num_clauses, dtype=np.int32)
+        self.num_active = self.num_clauses
+
+        # val[var]: 0 = unset, 1 = true, 2 = false
+        self.val = np.zeros(num_vars + 1, dtype=np.uint8)
+
+        # Preallocated event trail: one slot per assignable var plus one per
+        # literal occurrence (each occurrence yields at most one live event)
+        self.trail = np.empty(num_vars + len(lits) + 1, dtype=np.int64)
+        self.trail_len = 0
+
+        # VSIDS branching state: per-variable activity bumped on conflict
+        # clauses, decayed by scaling up the increment, and a lazy max-heap
+        # of (-activity, var) entries (stale/duplicate entries are skipped)
+        self.activity = np.zeros(num_vars + 1, dtype=np.float64)
+        self.var_inc = 1.0
+        self.var_decay = 0.95
+        vars_in_clauses = np.unique(self.lits >> 1) if len(lits) else []
+        self.order_heap = [(0.0, int(v)) for v in vars_in_clauses]
+        heapq.heapify(self.order_heap)
+        self._conflict_clause = -1
+
     def solve(self) -> Tuple[str, Optional[List[int]]]:
         """Main DPLL solver"""
         self.metrics.reset()
-        result = self._dpll(self.clauses, self.assignment.copy())
+        self._undo_to(0)  # Reset state in case solve() is called twice
+
+        # Apply any pre-seeded assignment (e.g. from preprocessing)
+        ok = True
+        for var, value in self.assignment.items():
+            if ok:
+                ok = self._assign_literal((var << 1) if value else ((var << 1) | 1))
 
-        if result:
+        if ok and self._dpll():
             model = []
             for var in range(1, self.num_vars + 1):
-                if var in self.assignment and self.assignment[var]:
+                if self.val[var] == 1:
                     model.append(var)
+                    self.assignment[var] = True
                 else:
                     model.append(-var)
             return "SAT", model
         return "UNSAT", None
 
-    def _dpll(self, clauses: List[List[int]], assignment: Dict[int, bool]) -> bool:
-        """Recursive DPLL algorithm"""
-        # Unit propagation
-        clauses, assignment = self._unit_propagate(clauses, assignment)
-        if clauses is None:  # Conflict
-            self.metrics.conflicts += 1
-            return False
-
-        # Check if satisfied
-        if not clauses:
-            self.assignment = assignment
-            return True
-
-        # Pure literal elimination
-        pure_lit = self._find_pure_literal(clauses)
-        if pure_lit:
-            return self._dpll(
-                self._assign_literal(clauses, pure_lit),
-                {**assignment, abs(pure_lit): pure_lit > 0}
-            )
-
-        # Choose branching variable (DLIS heuristic)
-        var = self._choose_variable(clauses)
-        self.metrics.decisions += 1
-
-        # Try positive polarity
-        new_clauses = self._assign_literal(clauses, var)
-        if self._dpll(new_clauses, {**assignment, var: True}):
-            return True
-
-        # Backtrack and try negative polarity
-        self.metrics.backtracks += 1
-        new_clauses = self._assign_literal(clauses, -var)
-        return self._dpll(new_clauses, {**assignment, var: False})
-
-    def _unit_propagate(self, clauses: List[List[int]], assignment: Dict[int, bool]) -> Tuple[Optional[List[List[int]]], Dict[int, bool]]:
-        """Naive unit propagation - checks all clauses"""
-        changed = True
-        while changed:
-            changed = False
-            unit_clauses = [c for c in clauses if len(c) == 1]
-
-            if not unit_clauses:
-                break
-
-            for unit_clause in unit_clauses:
-                lit = unit_clause[0]
-                var = abs(lit)
-                value = lit > 0
-
-                if var in assignment:
-                    if assignment[var] != value:
-                        return None, assignment  # Conflict
-                    continue
-
-                assignment = {**assignment, var: value}
-                clauses = self._assign_literal(clauses, lit)
-                self.metrics.unit_propagations += 1
-                changed = True
-
-                # Check for empty clause (conflict)
-                if any(len(c) == 0 for c in clauses):
-                    return None, assignment
+    def _dpll(self) -> bool:
+        """Iterative DPLL over the shared clause arrays.
+
+        Each stack frame records (var, tried_mask, trail_mark) for one
+        decision; bits 0/1 of tried_mask track the positive/negative
+        polarity. Pure-literal assignments get no frame — they are forced,
+        so a conflict below them unwinds to the enclosing decision. Using
+        an explicit stack avoids a Python frame per decision and keeps
+        deep searches clear of the recursion limit.
+        """
+        stack = []  # (var, tried_mask, trail_mark)
+        conflict = False
+
+        while True:
+            if conflict:
+                # Unwind to the most recent decision with an untried polarity
+                while stack and stack[-1][1] == 3:
+                    self._undo_to(stack.pop()[2])
+                if not stack:
+                    return False
 
-        return clauses, assignment
+                var, _, mark = stack[-1]
+                self._undo_to(mark)
+                stack[-1] = (var, 3, mark)
+                self.metrics.backtracks += 1
+                conflict = not self._assign_literal((var << 1) | 1)
+                continue
 
-    def _assign_literal(self, clauses: List[List[int]], lit: int) -> List[List[int]]:
-        """Assign a literal and simplify clauses"""
-        new_clauses = []
-        for clause in clauses:
-            if lit in clause:
-                continue  # Clause satisfied
-            new_clause = [l for l in clause if l != -lit]
-            new_clauses.append(new_clause)
-        return new_clauses
+            # Unit propagation
+            if not self._unit_propagate():
+                self.metrics.conflicts += 1
+                self._bump_conflict_clause()
+                conflict = True
+                continue
 
-    def _find_pure_literal(self, clauses: List[List[int]]) -> Optional[int]:
-        """Find a pure literal (appears only in one polarity)"""
-        positive = set()
-        negative = set()
+            # Check if satisfied
+            if self.num_active == 0:
+                return True
 
-        for clause in clauses:
-            for lit in clause:
-                if lit > 0:
-                    positive.add(lit)
-                else:
-                    negative.add(-lit)
+            # Pure literal elimination
+            pure_lit = self._find_pure_literal()
+            if pure_lit:
+                conflict = not self._assign_literal(pure_lit)
+                continue
 
-        pure_positive = positive - negative
-        if pure_positive:
-            return min(pure_positive)
+            # Choose branching variable (VSIDS heuristic), try positive first
+            var = self._choose_variable()
+            self.metrics.decisions += 1
+            stack.append((var, 1, self.trail_len))
+            conflict = not self._assign_literal(var << 1)
 
-        pure_negative = negative - positive
-        if pure_negative:
-            return -min(pure_negative)
+    def _unit_propagate(self) -> bool:
+        """Unit propagation via the flat-array kernel (jitted when available)"""
+        conflict_clause, self.trail_len, self.num_active, propagations = _propagate_flat(
+            self.num_clauses, self.lits, self.starts,
+            self.lens, self.sat_count, self.occ_start, self.occ_items,
+            self.val, self.trail, self.trail_len, self.num_active)
+        self.metrics.unit_propagations += propagations
+        self._conflict_clause = conflict_clause
+        return conflict_clause < 0
+
+    def _assign_literal(self, lit: int) -> bool:
+        """Assign an encoded literal in place, recording undo trail events.
+
+        Returns False if the assignment empties an active clause (conflict).
+        """
+        conflict_clause, self.trail_len, self.num_active = _assign_flat(
+            lit, self.lits, self.starts, self.lens,
+            self.sat_count, self.occ_start, self.occ_items,
+            self.val, self.trail, self.trail_len, self.num_active)
+        self._conflict_clause = conflict_clause
+        return conflict_clause < 0
+
+    def _undo_to(self, mark: int):
+        """Pop and invert trail events until the trail has length mark"""
+        # Unassigned variables go back into the branching heap
+        trail = self.trail
+        activity = self.activity
+        heap = self.order_heap
+        for p in range(mark, self.trail_len):
+            event = int(trail[p])
+            if event & 3 == 0:
+                var = event >> 2
+                heapq.heappush(heap, (-activity[var], var))
+        self.num_active = _undo_flat(
+            mark, self.lens, self.sat_count, self.val,
+            self.trail, self.trail_len, self.num_active)
+        self.trail_len = mark
+
+    def _bump_conflict_clause(self):
+        """Bump activity of all variables in the conflicting clause"""
+        clause_idx = self._conflict_clause
+        if clause_idx < 0:
+            return
+        start = int(self.starts[clause_idx])
+        end = int(self.starts[clause_idx + 1])
+        activity = self.activity
+        inc = self.var_inc
+        for k in range(start, end):
+            var = int(self.lits[k]) >> 1
+            activity[var] += inc
+            if activity[var] > 1e100:
+                self._rescale_activity()
+            heapq.heappush(self.order_heap, (-self.activity[var], var))
+        self.var_inc /= self.var_decay
+
+    def _rescale_activity(self):
+        """Scale all activities down to avoid float overflow"""
+        activity = self.activity
+        activity *= 1e-100  # One vectorized whole-array multiply
+        self.var_inc *= 1e-100
+        self.order_heap = [(-activity[var], var)
+                           for var in range(1, self.num_vars + 1)
+                           if self.val[var] == 0]
+        heapq.heapify(self.order_heap)
+
+    def _find_pure_literal(self) -> Optional[int]:
+        """Find a pure literal (appears only in one polarity), encoded.
+
+        Vectorized: a literal position is live when its clause is active
+        and it sits inside the clause's unshrunk slice, so the polarity
+        counts are one np.bincount over the live encoded literals instead
+        of Python set-building loops. Even/odd slices of the counts give
+        the per-variable positive/negative occurrence counts directly.
+        """
+        clause = self.lit_clause
+        live = (self.sat_count[clause] == 0) & \
+            (self.lit_pos < self.starts[clause] + self.lens[clause])
+        counts = np.bincount(self.lits[live], minlength=2 * self.num_vars + 2)
+        pos_counts = counts[0::2]
+        neg_counts = counts[1::2]
+
+        pure = np.nonzero((pos_counts > 0) & (neg_counts == 0))[0]
+        if pure.size:
+            return int(pure[0]) << 1
+
+        pure = np.nonzero((neg_counts > 0) & (pos_counts == 0))[0]
+        if pure.size:
+            return (int(pure[0]) << 1) | 1
 
         return None
 
-    def _choose_variable(self, clauses: List[List[int]]) -> int:
-        """DLIS heuristic: choose most frequent literal"""
-        lit_count = defaultdict(int)
-
-        for clause in clauses:
-            for lit in clause:
-                lit_count[lit] += 1
-
-        if not lit_count:
-            return 1
+    def _choose_variable(self) -> int:
+        """VSIDS heuristic: pop the highest-activity unassigned variable"""
+        heap = self.order_heap
+        val = self.val
+        while heap:
+            _, var = heapq.heappop(heap)
+            if val[var] == 0:
+                return var
 
-        best_lit = max(lit_count.keys(), key=lambda l: lit_count[l])
-        return abs(best_lit)
+        # Heap exhausted (stale entries only): any unassigned variable
+        for var in range(1, self.num_vars + 1):
+            if val[var] == 0:
+                return var
+        return 1
 
 
 class WatchedLiteralsDPLL:
     """
-    DPLL with 2-watched literals scheme
-    - Each clause watches 2 literals
-    - Only examine clause when watched literal becomes false
-    - Dramatically reduces clause checks during unit propagation
+    CDCL solver with 2-watched literals scheme
+    - Each clause watches 2 literals (positions 0 and 1), with a blocker
+      literal per watcher to skip the clause load when already satisfied
+    - Only examine clause when a watched literal becomes false
+    - Conflicts are analyzed to the first unique implication point (1-UIP),
+      the derived clause is learned and the search backjumps
+      non-chronologically to the second-highest level in it
     """
 
     def __init__(self, clauses: Iterable[Iterable[int]], num_vars: int):
         self.num_vars = num_vars
-        self.original_clauses = [list(c) for c in clauses]
+        # Materialize the outer list once; _initialize_watches builds its
+        # own encoded clause lists, so no per-clause copy is needed
+        self.original_clauses = list(clauses)
         self.metrics = SolverMetrics()
 
-        # Watched literals data structures
+        # Watched literals data structures. Clauses hold encoded literals
+        # (2v positive / 2v+1 negative); watches is a flat list indexed
+        # directly by encoded literal, each entry (clause_idx, blocker)
         self.clauses = []
-        self.watches = defaultdict(list)  # lit -> list of clause indices watching it
-        self.assignment = {}  # var -> True/False
-
+        self.watches = [[] for _ in range(2 * (num_vars + 1))]
+        # Binary clauses bypass the watch machinery: bin_imps[lit] lists
+        # (implied_lit, clause_idx) pairs that fire when lit becomes true
+        self.bin_imps = [[] for _ in range(2 * (num_vars + 1))]
+        self.assignment = {}  # var -> True/False (seed/result interface)
+
+        # val[var]: 0 = unset, 1 = true, 2 = false
+        self.val = bytearray(num_vars + 1)
+        self.trail = []  # assigned literals, in order
+        self.qhead = 0   # propagation queue head into trail
+
+        # CDCL bookkeeping: implying clause (-1 for decisions/seeds) and
+        # decision level per assigned variable; trail_lim marks the trail
+        # length at each decision, so len(trail_lim) is the current level
+        self.reason = [-1] * (num_vars + 1)
+        self.level = [0] * (num_vars + 1)
+        self.trail_lim = []
+
+        # Phase saving: last polarity per variable (1 = true-first default),
+        # recorded on backtrack and tried first at the next decision
+        self.phase = bytearray(b'\x01' * (num_vars + 1))
+
+        self._initial_units = []
+        self._has_empty_clause = False
         self._initialize_watches()
 
+        # VSIDS branching state (same scheme as BaseDPLL): lazy max-heap of
+        # (-activity, var), bumped on conflict clauses, decayed via var_inc
+        self.activity = np.zeros(num_vars + 1, dtype=np.float64)
+        self.var_inc = 1.0
+        self.var_decay = 0.95
+        vars_in_clauses = {lit >> 1 for clause in self.clauses for lit in clause}
+        vars_in_clauses.update(lit >> 1 for lit in self._initial_units)
+        self.order_heap = [(0.0, var) for var in sorted(vars_in_clauses)]
+        heapq.heapify(self.order_heap)
+
     def _initialize_watches(self):
-        """Initialize 2-watched literals for each clause"""
+        """Encode clauses and initialize 2-watched literals for each"""
         for clause in self.original_clauses:
-            clause_idx = len(self.clauses)
-            self.clauses.append(clause[:])
-
-            # Watch first two literals (or fewer if clause is smaller)
-            if len(clause) >= 1:
-                self.watches[clause[0]].append(clause_idx)
-            if len(clause) >= 2:
-                self.watches[clause[1]].append(clause_idx)
+            encoded = [(l << 1) if l > 0 else ((-l << 1) | 1) for l in clause]
+            if len(encoded) == 0:
+                self._has_empty_clause = True
+            elif len(encoded) == 1:
+                # Globally forced literal - no need to watch
+                self._initial_units.append(encoded[0])
+            elif len(encoded) == 2:
+                # Watching both literals of a binary clause is pure
+                # overhead - store it as two direct implications instead.
+                # The clause still gets an index so it can serve as a
+                # reason in conflict analysis.
+                clause_idx = len(self.clauses)
+                self.clauses.append(encoded)
+                self.bin_imps[encoded[0] ^ 1].append((encoded[1], clause_idx))
+                self.bin_imps[encoded[1] ^ 1].append((encoded[0], clause_idx))
+            else:
+                clause_idx = len(self.clauses)
+                self.clauses.append(encoded)
+                # Watch the first two literals, each blocking on the other
+                self.watches[encoded[0]].append((clause_idx, encoded[1]))
+                self.watches[encoded[1]].append((clause_idx, encoded[0]))
 
     def solve(self) -> Tuple[str, Optional[List[int]]]:
-        """Main DPLL solver with watched literals"""
+        """Main CDCL solver with watched literals"""
         self.metrics.reset()
-        result = self._dpll()
+        self._cancel_to(0)  # Reset state in case solve() is called twice
+        self.trail_lim = []
+
+        if self._has_empty_clause:
+            return "UNSAT", None
 
-        if result:
+        # Apply pre-seeded assignment and globally forced units (level 0)
+        ok = True
+        for var, value in self.assignment.items():
+            ok = ok and self._enqueue((var << 1) if value else ((var << 1) | 1))
+        for lit in self._initial_units:
+            ok = ok and self._enqueue(lit)
+
+        if ok and self._search():
             model = []
             for var in range(1, self.num_vars + 1):
-                if self.assignment.get(var, False):
+                if self.val[var] == 1:
                     model.append(var)
+                    self.assignment[var] = True
                 else:
                     model.append(-var)
             return "SAT", model
         return "UNSAT", None
 
-    def _dpll(self) -> bool:
-        """Recursive DPLL with watched literals"""
-        # Unit propagation
-        if not self._unit_propagate():
-            self.metrics.conflicts += 1
-            return False
-
-        # Check if all variables assigned
-        if len(self.assignment) == self.num_vars:
-            return True
-
-        # Choose branching variable
-        var = self._choose_variable()
-        if var is None:
-            return True
-
-        self.metrics.decisions += 1
-
-        # Try positive polarity
-        saved_state = self._save_state()
-        self.assignment[var] = True
-        if self._dpll():
-            return True
-
-        # Backtrack and try negative
-        self._restore_state(saved_state)
-        self.metrics.backtracks += 1
-        self.assignment[var] = False
-        if self._dpll():
-            return True
-
-        # Both failed, backtrack further
-        self._restore_state(saved_state)
-        return False
-
-    def _unit_propagate(self) -> bool:
-        """Efficient unit propagation with watched literals"""
-        queue = deque()
-
-        # Find initial unit clauses
-        for clause_idx, clause in enumerate(self.clauses):
-            if self._is_unit_clause(clause_idx):
-                queue.append(clause_idx)
+    def _search(self) -> bool:
+        """CDCL search loop: propagate, learn from conflicts, backjump"""
+        while True:
+            conflict_clause = self._unit_propagate()
 
-        while queue:
-            clause_idx = queue.popleft()
-            clause = self.clauses[clause_idx]
+            if conflict_clause >= 0:
+                self.metrics.conflicts += 1
+                if not self.trail_lim:
+                    return False  # Conflict at level 0
 
-            # Find the unit literal
-            unit_lit = self._get_unit_literal(clause)
-            if unit_lit is None:
+                learnt, backjump_level = self._analyze(conflict_clause)
+                self._cancel_until(backjump_level)
+                self.metrics.backtracks += 1
+                self._record_learnt(learnt)
                 continue
 
-            var = abs(unit_lit)
-            value = unit_lit > 0
+            # No conflict: all variables assigned means SAT
+            if len(self.trail) == self.num_vars:
+                return True
+
+            var = self._choose_variable()
+            if var is None:
+                return True
+
+            # New decision at the saved phase
+            self.metrics.decisions += 1
+            self.trail_lim.append(len(self.trail))
+            self._enqueue((var << 1) if self.phase[var] else ((var << 1) | 1))
+
+    def _analyze(self, conflict_clause: int) -> Tuple[List[int], int]:
+        """1-UIP conflict analysis.
+
+        Resolves the conflicting clause backwards along the trail until only
+        one literal of the current decision level remains (the first unique
+        implication point). Returns the learnt clause - asserting literal
+        first, a highest-remaining-level literal second - and the level to
+        backjump to. Every variable seen during resolution gets a VSIDS bump.
+        """
+        learnt = [0]  # Slot 0 reserved for the asserting (negated UIP) literal
+        seen = bytearray(self.num_vars + 1)
+        level = self.level
+        trail = self.trail
+        current_level = len(self.trail_lim)
+
+        counter = 0  # Unresolved literals at the current level
+        p = 0        # Literal most recently resolved on (0 = none yet)
+        reason_lits = self.clauses[conflict_clause]
+        idx = len(trail) - 1
+
+        while True:
+            for lit in reason_lits:
+                if lit == p:
+                    continue
+                var = lit >> 1
+                if not seen[var] and level[var] > 0:
+                    seen[var] = 1
+                    self._bump_var(var)
+                    if level[var] >= current_level:
+                        counter += 1
+                    else:
+                        learnt.append(lit)
+
+            # Walk back to the next trail literal involved in the conflict
+            while not seen[trail[idx] >> 1]:
+                idx -= 1
+            p = trail[idx]
+            var = p >> 1
+            idx -= 1
+            seen[var] = 0
+            counter -= 1
+            if counter == 0:
+                break
+            reason_lits = self.clauses[self.reason[var]]
 
-            # Check for conflict
-            if var in self.assignment:
-                if self.assignment[var] != value:
-                    return False
-                continue
+        learnt[0] = p ^ 1
+        self.var_inc /= self.var_decay
 
-            # Assign the literal
-            self.assignment[var] = value
-            self.metrics.unit_propagations += 1
+        if len(learnt) == 1:
+            return learnt, 0
 
-            # Update watches and find new unit clauses
-            falsified_lit = -unit_lit
-            for watched_clause_idx in self.watches[falsified_lit][:]:
-                if self._is_unit_clause(watched_clause_idx):
-                    queue.append(watched_clause_idx)
-                elif self._is_conflicting(watched_clause_idx):
-                    return False
+        # Backjump to the second-highest level; put one of its literals in
+        # the watched position 1
+        max_k = max(range(1, len(learnt)), key=lambda k: level[learnt[k] >> 1])
+        learnt[1], learnt[max_k] = learnt[max_k], learnt[1]
+        return learnt, level[learnt[1] >> 1]
 
+    def _record_learnt(self, learnt: List[int]):
+        """Attach a learnt clause and enqueue its asserting literal"""
+        if len(learnt) == 1:
+            self._enqueue(learnt[0])
+        elif len(learnt) == 2:
+            clause_idx = len(self.clauses)
+            self.clauses.append(learnt)
+            self.bin_imps[learnt[0] ^ 1].append((learnt[1], clause_idx))
+            self.bin_imps[learnt[1] ^ 1].append((learnt[0], clause_idx))
+            self._enqueue(learnt[0], clause_idx)
+        else:
+            clause_idx = len(self.clauses)
+            self.clauses.append(learnt)
+            self.watches[learnt[0]].append((clause_idx, learnt[1]))
+            self.watches[learnt[1]].append((clause_idx, learnt[0]))
+            self._enqueue(learnt[0], clause_idx)
+        self.metrics.unit_propagations += 1
+
+    def _cancel_until(self, backjump_level: int):
+        """Backjump: undo all assignments above the given decision level"""
+        if len(self.trail_lim) > backjump_level:
+            self._cancel_to(self.trail_lim[backjump_level])
+            del self.trail_lim[backjump_level:]
+
+    def _enqueue(self, lit: int, reason: int = -1) -> bool:
+        """Assign an encoded literal and queue it for propagation.
+
+        Returns False if lit is already assigned the opposite value.
+        """
+        var = lit >> 1
+        want = 1 + (lit & 1)
+        current = self.val[var]
+        if current != 0:
+            return current == want
+        self.val[var] = want
+        self.reason[var] = reason
+        self.level[var] = len(self.trail_lim)
+        self.trail.append(lit)
         return True
 
-    def _is_unit_clause(self, clause_idx: int) -> bool:
-        """Check if clause is unit under current assignment"""
-        clause = self.clauses[clause_idx]
-        unassigned = []
-
-        for lit in clause:
-            var = abs(lit)
-            if var not in self.assignment:
-                unassigned.append(lit)
-            elif self.assignment[var] == (lit > 0):
-                return False  # Clause satisfied
-
-        return len(unassigned) == 1
-
-    def _is_conflicting(self, clause_idx: int) -> bool:
-        """Check if clause is conflicting (all literals false)"""
-        clause = self.clauses[clause_idx]
-        for lit in clause:
-            var = abs(lit)
-            if var not in self.assignment:
-                return False
-            if self.assignment[var] == (lit > 0):
-                return False
-        return True
+    def _unit_propagate(self) -> int:
+        """Unit propagation maintaining the two-watched-literal invariant.
+
+        When a watched literal becomes false, the clause is walked to find a
+        non-false replacement watch; if none exists the other watch is either
+        unit (enqueue) or false (conflict). Returns the index of the
+        conflicting clause, or -1 if propagation completes without conflict.
+        """
+        # Hot attribute loads hoisted out of the inner loop; qhead is kept
+        # local and written back on every exit path
+        val = self.val
+        trail = self.trail
+        watches = self.watches
+        clauses = self.clauses
+        bin_imps = self.bin_imps
+        qhead = self.qhead
+        propagations = 0  # Accumulated locally, written back once per exit
+        while qhead < len(trail):
+            lit = trail[qhead]
+            qhead += 1
+
+            # Binary implications first: one list lookup per assignment,
+            # no clause data touched
+            for implied, clause_idx in bin_imps[lit]:
+                value = val[implied >> 1]
+                if value == 0:
+                    self._enqueue(implied, clause_idx)
+                    propagations += 1
+                elif value == 2 - (implied & 1):
+                    self.qhead = qhead
+                    self.metrics.unit_propagations += propagations
+                    return clause_idx
+
+            false_lit = lit ^ 1
+            watchers = watches[false_lit]
+            keep = 0
+            i = 0
+            while i < len(watchers):
+                clause_idx, blocker = watchers[i]
+                i += 1
+
+                # Fast path: blocker already true, clause satisfied
+                if val[blocker >> 1] == 1 + (blocker & 1):
+                    watchers[keep] = (clause_idx, blocker)
+                    keep += 1
+                    continue
 
-    def _get_unit_literal(self, clause: List[int]) -> Optional[int]:
-        """Get the unit literal from a unit clause"""
-        for lit in clause:
-            var = abs(lit)
-            if var not in self.assignment:
-                return lit
-        return None
+                clause = clauses[clause_idx]
 
-    def _choose_variable(self) -> Optional[int]:
-        """Choose unassigned variable with DLIS heuristic"""
-        lit_count = defaultdict(int)
-
-        for clause in self.clauses:
-            # Skip satisfied clauses
-            if any(abs(lit) in self.assignment and
-                   self.assignment[abs(lit)] == (lit > 0)
-                   for lit in clause):
-                continue
+                # Normalize: put the falsified watch at position 1
+                if clause[0] == false_lit:
+                    clause[0], clause[1] = clause[1], clause[0]
+                first = clause[0]
 
-            for lit in clause:
-                if abs(lit) not in self.assignment:
-                    lit_count[abs(lit)] += 1
+                # Other watch already true: keep watcher, blocking on it
+                if val[first >> 1] == 1 + (first & 1):
+                    watchers[keep] = (clause_idx, first)
+                    keep += 1
+                    continue
 
-        if not lit_count:
-            return None
+                # Look for a non-false replacement watch
+                moved = False
+                for k in range(2, len(clause)):
+                    cand = clause[k]
+                    if val[cand >> 1] != 2 - (cand & 1):
+                        clause[1], clause[k] = clause[k], clause[1]
+                        watches[cand].append((clause_idx, first))
+                        moved = True
+                        break
+                if moved:
+                    continue
 
-        return max(lit_count.keys(), key=lambda v: lit_count[v])
+                # No replacement: clause is unit on first, or conflicting
+                watchers[keep] = (clause_idx, first)
+                keep += 1
+                if val[first >> 1] == 2 - (first & 1):
+                    # Conflict - keep the remaining watchers before bailing
+                    while i < len(watchers):
+                        watchers[keep] = watchers[i]
+                        keep += 1
+                        i += 1
+                    del watchers[keep:]
+                    self.qhead = qhead
+                    self.metrics.unit_propagations += propagations
+                    return clause_idx
+
+                self._enqueue(first, clause_idx)
+                propagations += 1
+
+            del watchers[keep:]
+
+        self.qhead = qhead
+        self.metrics.unit_propagations += propagations
+        return -1
+
+    def _cancel_to(self, mark: int):
+        """Undo trail assignments down to the given trail length"""
+        trail = self.trail
+        val = self.val
+        activity = self.activity
+        heap = self.order_heap
+        phase = self.phase
+        while len(trail) > mark:
+            lit = trail.pop()
+            var = lit >> 1
+            phase[var] = 1 if val[var] == 1 else 0  # Save polarity
+            val[var] = 0
+            # Unassigned variables go back into the branching heap
+            heapq.heappush(heap, (-activity[var], var))
+        self.qhead = mark
 
-    def _save_state(self) -> Dict:
-        """Save current state for backtracking"""
-        return {
-            'assignment': self.assignment.copy()
-        }
+    def _choose_variable(self) -> Optional[int]:
+        """VSIDS heuristic: pop the highest-activity unassigned variable"""
+        heap = self.order_heap
+        val = self.val
+        while heap:
+            _, var = heapq.heappop(heap)
+            if val[var] == 0:
+                return var
+
+        # Heap exhausted (stale entries only): any unassigned variable
+        for var in range(1, self.num_vars + 1):
+            if val[var] == 0:
+                return var
+        return None
 
-    def _restore_state(self, state: Dict):
-        """Restore state after backtracking"""
-        self.assignment = state['assignment']
+    def _bump_var(self, var: int):
+        """Bump a variable's VSIDS activity"""
+        activity = self.activity
+        activity[var] += self.var_inc
+        if activity[var] > 1e100:
+            self._rescale_activity()
+        heapq.heappush(self.order_heap, (-activity[var], var))
+
+    def _rescale_activity(self):
+        """Scale all activities down to avoid float overflow"""
+        activity = self.activity
+        activity *= 1e-100  # One vectorized whole-array multiply
+        self.var_inc *= 1e-100
+        self.order_heap = [(-activity[var], var)
+                           for var in range(1, self.num_vars + 1)
+                           if self.val[var] == 0]
+        heapq.heapify(self.order_heap)
 
 
 class PreprocessingDPLL:
@@ -369,7 +818,9 @@ class PreprocessingDPLL:
 
     def __init__(self, clauses: Iterable[Iterable[int]], num_vars: int):
         self.num_vars = num_vars
-        self.original_clauses = [list(c) for c in clauses]
+        # Materialize the outer list once; clauses are never mutated by
+        # preprocessing, so no per-clause copy is needed
+        self.original_clauses = list(clauses)
         self.metrics = SolverMetrics()
         self.assignment = {}
 
@@ -377,12 +828,19 @@ class PreprocessingDPLL:
         self.vars_eliminated = 0
         self.clauses_eliminated = 0
 
+        # (var, pos_clauses, neg_clauses) per BVE-eliminated variable,
+        # used to extend models back over eliminated variables
+        self._eliminated = []
+
     def solve(self) -> Tuple[str, Optional[List[int]]]:
         """Solve with preprocessing"""
         self.metrics.reset()
 
         # Preprocessing phase
-        clauses = self._preprocess(self.original_clauses)
+        clauses, assignment, stats = preprocess(
+            self.original_clauses, self.num_vars, self.metrics)
+        self.assignment.update(assignment)
+        self.vars_eliminated, self.clauses_eliminated, self._eliminated = stats
 
         if clauses is None:
             return "UNSAT", None
@@ -394,7 +852,7 @@ class PreprocessingDPLL:
                     model.append(var)
                 else:
                     model.append(-var)
-            return "SAT", model
+            return "SAT", restore_eliminated(model, self._eliminated, self.assignment)
 
         # DPLL search phase
         base_solver = BaseDPLL(clauses, self.num_vars)
@@ -407,150 +865,289 @@ class PreprocessingDPLL:
         self.metrics.unit_propagations += base_solver.metrics.unit_propagations
         self.metrics.conflicts = base_solver.metrics.conflicts
 
+        if status == "SAT":
+            model = restore_eliminated(model, self._eliminated, self.assignment)
         return status, model
 
-    def _preprocess(self, clauses: List[List[int]]) -> Optional[List[List[int]]]:
-        """Apply preprocessing techniques"""
-        # 1. Exhaustive unit propagation
-        clauses, assignment = self._exhaustive_unit_propagation(clauses)
-        if clauses is None:
-            return None
-        self.assignment.update(assignment)
 
-        # 2. Pure literal elimination
-        clauses = self._pure_literal_elimination(clauses)
+def preprocess(clauses: List[List[int]], num_vars: int,
+               metrics: SolverMetrics,
+               max_new_clauses: int = 10) -> Tuple[Optional[List[List[int]]], Dict[int, bool], Tuple[int, int, list]]:
+    """Run the full preprocessing pipeline over a clause list.
 
-        # 3. Subsumption elimination
-        clauses = self._subsumption_elimination(clauses)
+    Shared by PreprocessingDPLL and CombinedDPLL so neither has to build a
+    throwaway solver object (or re-copy the clause list) just to preprocess.
+    Returns (clauses, assignment, stats): clauses is None on a conflict
+    found during preprocessing; stats is (vars_eliminated,
+    clauses_eliminated, eliminated) where eliminated records the BVE'd
+    variables for restore_eliminated.
+    """
+    # 1. Exhaustive unit propagation
+    clauses, assignment = _exhaustive_unit_propagation(clauses, num_vars, metrics)
+    if clauses is None:
+        return None, assignment, (0, 0, [])
 
-        # 4. Bounded variable elimination (limited)
-        clauses = self._bounded_variable_elimination(clauses, max_new_clauses=10)
+    # 2. Pure literal elimination
+    clauses = _pure_literal_elimination(clauses, assignment)
 
-        return clauses
+    # 3. Subsumption elimination
+    clauses, clauses_eliminated = _subsumption_elimination(clauses)
 
-    def _exhaustive_unit_propagation(self, clauses: List[List[int]]) -> Tuple[Optional[List[List[int]]], Dict[int, bool]]:
-        """Exhaustive unit propagation"""
-        assignment = {}
-        changed = True
+    # 4. Bounded variable elimination (limited)
+    clauses, vars_eliminated, eliminated = _bounded_variable_elimination(
+        clauses, max_new_clauses)
 
-        while changed:
-            changed = False
-            unit_clauses = [c for c in clauses if len(c) == 1]
+    return clauses, assignment, (vars_eliminated, clauses_eliminated, eliminated)
 
-            if not unit_clauses:
-                break
 
-            for unit_clause in unit_clauses:
-                lit = unit_clause[0]
-                var = abs(lit)
-                value = lit > 0
+def _exhaustive_unit_propagation(clauses: List[List[int]], num_vars: int,
+                                 metrics: SolverMetrics) -> Tuple[Optional[List[List[int]]], Dict[int, bool]]:
+    """Exhaustive unit propagation.
 
-                if var in assignment:
-                    if assignment[var] != value:
-                        return None, assignment
-                    continue
+    Uses a bytearray value map (0 = unset, 1 = true, 2 = false) instead
+    of a dict, so literal checks are direct byte compares. The dict form
+    is only materialized once at the end for the caller interface.
+    """
+    val = bytearray(num_vars + 1)
+    pending = [c[0] for c in clauses if len(c) == 1]
+
+    while pending:
+        for lit in pending:
+            var = lit if lit > 0 else -lit
+            want = 1 if lit > 0 else 2
+            if val[var] != 0:
+                if val[var] != want:
+                    return None, {}
+                continue
+            val[var] = want
+            metrics.unit_propagations += 1
 
-                assignment[var] = value
-                self.metrics.unit_propagations += 1
-                changed = True
+        # One fused pass per round: drop satisfied clauses, strip false
+        # literals, detect empty clauses and collect the next round of
+        # units — instead of separate collect-units and simplify scans
+        pending = []
+        new_clauses = []
+        for clause in clauses:
+            satisfied = False
+            new_clause = []
+            for lit in clause:
+                var = lit if lit > 0 else -lit
+                want = 1 if lit > 0 else 2
+                if val[var] == want:
+                    satisfied = True
+                    break
+                if val[var] == 0:
+                    new_clause.append(lit)
+            if satisfied:
+                continue
+            if not new_clause:
+                return None, {}  # Conflict
+            if len(new_clause) == 1:
+                pending.append(new_clause[0])
+            new_clauses.append(new_clause)
+        clauses = new_clauses
 
-                # Simplify clauses
-                new_clauses = []
-                for clause in clauses:
-                    if lit in clause:
-                        continue  # Satisfied
-                    new_clause = [l for l in clause if l != -lit]
-                    if len(new_clause) == 0:
-                        return None, assignment  # Conflict
-                    new_clauses.append(new_clause)
-                clauses = new_clauses
+    assignment = {var: val[var] == 1
+                  for var in range(1, num_vars + 1) if val[var] != 0}
+    return clauses, assignment
 
-        return clauses, assignment
 
-    def _pure_literal_elimination(self, clauses: List[List[int]]) -> List[List[int]]:
-        """Eliminate pure literals"""
-        positive = set()
-        negative = set()
+def _pure_literal_elimination(clauses: List[List[int]],
+                              assignment: Dict[int, bool]) -> List[List[int]]:
+    """Eliminate pure literals, recording them in assignment"""
+    positive = set()
+    negative = set()
 
-        for clause in clauses:
-            for lit in clause:
-                if lit > 0:
-                    positive.add(lit)
-                else:
-                    negative.add(-lit)
-
-        pure_lits = []
-        for var in positive:
-            if var not in negative:
-                pure_lits.append(var)
-        for var in negative:
-            if var not in positive:
-                pure_lits.append(-var)
-
-        # Assign pure literals
-        for lit in pure_lits:
-            var = abs(lit)
-            self.assignment[var] = lit > 0
-            clauses = [c for c in clauses if lit not in c]
-
-        return clauses
-
-    def _subsumption_elimination(self, clauses: List[List[int]]) -> List[List[int]]:
-        """Remove subsumed clauses"""
-        clauses_set = [set(c) for c in clauses]
-        to_keep = []
-
-        for i, c1 in enumerate(clauses_set):
-            subsumed = False
-            for j, c2 in enumerate(clauses_set):
-                if i != j and c2.issubset(c1):
-                    subsumed = True
-                    self.clauses_eliminated += 1
-                    break
-            if not subsumed:
-                to_keep.append(clauses[i])
+    for clause in clauses:
+        for lit in clause:
+            if lit > 0:
+                positive.add(lit)
+            else:
+                negative.add(-lit)
+
+    pure_lits = []
+    for var in positive:
+        if var not in negative:
+            pure_lits.append(var)
+    for var in negative:
+        if var not in positive:
+            pure_lits.append(-var)
+
+    # Assign pure literals
+    for lit in pure_lits:
+        var = abs(lit)
+        assignment[var] = lit > 0
+        clauses = [c for c in clauses if lit not in c]
+
+    return clauses
+
+
+def _subsumption_elimination(clauses: List[List[int]]) -> Tuple[List[List[int]], int]:
+    """Remove subsumed clauses.
+
+    Signature + occurrence-list algorithm: each clause gets a 64-bit
+    Bloom-style signature, and subsumer candidates for a clause are only
+    drawn from the occurrence list of its rarest literal. A clause is
+    dropped when some other clause is a subset of it.
+    """
+    frozen = [frozenset(c) for c in clauses]
 
-        return to_keep
+    signatures = []
+    occ = defaultdict(list)
+    for i, clause in enumerate(frozen):
+        sig = 0
+        for lit in clause:
+            sig |= 1 << (hash(lit) & 63)
+        signatures.append(sig)
+        for lit in clause:
+            occ[lit].append(i)
+
+    n_eliminated = 0
+    subsumed = bytearray(len(clauses))
+    for i, c1 in enumerate(frozen):
+        if not c1:
+            continue
+        sig_mask = ~signatures[i]
+        # Only clauses sharing the rarest literal of c1 can subsume it
+        rare_lit = min(c1, key=lambda l: len(occ[l]))
+        for j in occ[rare_lit]:
+            if j == i or subsumed[j]:
+                continue
+            if len(frozen[j]) > len(c1):
+                continue
+            if signatures[j] & sig_mask:
+                continue  # c2 has a literal c1 cannot contain
+            if frozen[j].issubset(c1):
+                subsumed[i] = 1
+                n_eliminated += 1
+                break
 
-    def _bounded_variable_elimination(self, clauses: List[List[int]], max_new_clauses: int = 10) -> List[List[int]]:
-        """Eliminate variables with bounded resolution"""
-        # Count variable occurrences
-        var_occurrences = defaultdict(lambda: {'pos': [], 'neg': []})
+    return [c for i, c in enumerate(clauses) if not subsumed[i]], n_eliminated
 
-        for i, clause in enumerate(clauses):
-            for lit in clause:
-                var = abs(lit)
+
+def _bounded_variable_elimination(clauses: List[List[int]],
+                                  max_new_clauses: int = 10) -> Tuple[List[List[int]], int, list]:
+    """Eliminate variables with bounded resolution.
+
+    Occurrence lists are kept as sets of clause ids and clauses are
+    removed with an O(1) deletion flag rather than rebuilding the clause
+    list per eliminated variable. Candidates come off a min-heap keyed on
+    len(pos)*len(neg); tautological resolvents are discarded, and a
+    variable is only eliminated if the surviving resolvents do not
+    outnumber the clauses they replace. Eliminated variables are recorded
+    so models can be extended back over them after the search.
+    """
+    clauses = list(clauses)
+    deleted = bytearray(len(clauses))
+
+    occ_pos = defaultdict(set)
+    occ_neg = defaultdict(set)
+    for i, clause in enumerate(clauses):
+        for lit in clause:
+            if lit > 0:
+                occ_pos[lit].add(i)
+            else:
+                occ_neg[-lit].add(i)
+
+    all_vars = set(occ_pos) | set(occ_neg)
+    heap = [(len(occ_pos[v]) * len(occ_neg[v]), v) for v in all_vars]
+    heapq.heapify(heap)
+    eliminated_vars = set()
+    eliminated = []
+
+    while heap:
+        cost, var = heapq.heappop(heap)
+        if var in eliminated_vars:
+            continue
+        actual_cost = len(occ_pos[var]) * len(occ_neg[var])
+        if actual_cost != cost:
+            heapq.heappush(heap, (actual_cost, var))  # Stale entry
+            continue
+        if actual_cost > max_new_clauses:
+            continue
+
+        # A clause holding both polarities of the pivot is a tautology;
+        # left in place it would resolve against itself and fabricate
+        # spurious resolvents (the empty clause for [v, -v]). Dropping
+        # it outright is sound, so do that before forming resolvents.
+        for cid in occ_pos[var] & occ_neg[var]:
+            deleted[cid] = 1
+            for lit in clauses[cid]:
+                if lit > 0:
+                    occ_pos[lit].discard(cid)
+                else:
+                    occ_neg[-lit].discard(cid)
+
+        pos_ids = sorted(occ_pos[var])
+        neg_ids = sorted(occ_neg[var])
+
+        # Form non-tautological resolvents
+        resolvents = []
+        for p_cid in pos_ids:
+            pos_set = set(clauses[p_cid])
+            for n_cid in neg_ids:
+                resolvent = (pos_set | set(clauses[n_cid])) - {var, -var}
+                if any(-l in resolvent for l in resolvent):
+                    continue  # Tautology
+                resolvents.append(resolvent)
+
+        # Standard BVE bound: don't let the formula grow
+        if len(resolvents) > len(pos_ids) + len(neg_ids):
+            continue
+
+        # Eliminate: drop the old clauses, record them for model
+        # reconstruction, then splice in the resolvents
+        eliminated_vars.add(var)
+        eliminated.append((
+            var,
+            [clauses[i] for i in pos_ids],
+            [clauses[i] for i in neg_ids],
+        ))
+
+        for cid in pos_ids + neg_ids:
+            deleted[cid] = 1
+            for lit in clauses[cid]:
                 if lit > 0:
-                    var_occurrences[var]['pos'].append(i)
+                    occ_pos[lit].discard(cid)
                 else:
-                    var_occurrences[var]['neg'].append(i)
+                    occ_neg[-lit].discard(cid)
 
-        # Try to eliminate variables
-        for var, occ in var_occurrences.items():
-            pos_clauses = [clauses[i] for i in occ['pos']]
-            neg_clauses = [clauses[i] for i in occ['neg']]
+        for resolvent in resolvents:
+            cid = len(clauses)
+            clauses.append(list(resolvent))
+            deleted.append(0)
+            for lit in resolvent:
+                if lit > 0:
+                    occ_pos[lit].add(cid)
+                else:
+                    occ_neg[-lit].add(cid)
 
-            # Estimate new clauses from resolution
-            new_clause_count = len(pos_clauses) * len(neg_clauses)
+    return ([c for i, c in enumerate(clauses) if not deleted[i]],
+            len(eliminated), eliminated)
 
-            if new_clause_count <= max_new_clauses:
-                # Eliminate variable
-                self.vars_eliminated += 1
 
-                # Remove clauses containing var
-                clauses = [c for i, c in enumerate(clauses)
-                          if i not in occ['pos'] and i not in occ['neg']]
+def restore_eliminated(model: List[int], eliminated: list,
+                       assignment: Dict[int, bool]) -> List[int]:
+    """Extend a model over the variables removed by BVE.
 
-                # Add resolvents
-                for pos_clause in pos_clauses:
-                    for neg_clause in neg_clauses:
-                        resolvent = set(pos_clause) | set(neg_clause)
-                        resolvent.discard(var)
-                        resolvent.discard(-var)
-                        if resolvent:  # Non-tautology
-                            clauses.append(list(resolvent))
+    Walk the eliminations in reverse; a variable becomes true exactly
+    when one of its positive clauses is not already satisfied. The
+    caller's assignment dict is updated alongside the model.
+    """
+    assign = {abs(lit): lit > 0 for lit in model}
+
+    for var, pos_clauses, neg_clauses in reversed(eliminated):
+        value = False
+        for clause in pos_clauses:
+            if not any(assign.get(abs(l), False) == (l > 0)
+                       for l in clause if abs(l) != var):
+                value = True
+                break
+        assign[var] = value
+        assignment[var] = value
+        model[var - 1] = var if value else -var
 
-        return clauses
+    return model
 
 
 class CombinedDPLL:
@@ -563,7 +1160,9 @@ class CombinedDPLL:
 
     def __init__(self, clauses: Iterable[Iterable[int]], num_vars: int):
         self.num_vars = num_vars
-        self.original_clauses = [list(c) for c in clauses]
+        # Materialize the outer list once; preprocessing never mutates
+        # clauses, so no per-clause copy is needed
+        self.original_clauses = list(clauses)
         self.metrics = SolverMetrics()
         self.assignment = {}
         self.phase_cache = {}  # Variable -> last polarity
@@ -576,14 +1175,12 @@ class CombinedDPLL:
         """Solve with all optimizations"""
         self.metrics.reset()
 
-        # Preprocessing phase
-        preprocessor = PreprocessingDPLL(self.original_clauses, self.num_vars)
-        clauses = preprocessor._preprocess(self.original_clauses)
-
-        self.assignment.update(preprocessor.assignment)
-        self.metrics.unit_propagations += preprocessor.metrics.unit_propagations
-        self.vars_eliminated = preprocessor.vars_eliminated
-        self.clauses_eliminated = preprocessor.clauses_eliminated
+        # Preprocessing phase (shared module-level pipeline, no throwaway
+        # PreprocessingDPLL instance)
+        clauses, assignment, stats = preprocess(
+            self.original_clauses, self.num_vars, self.metrics)
+        self.assignment.update(assignment)
+        self.vars_eliminated, self.clauses_eliminated, eliminated = stats
 
         if clauses is None:
             return "UNSAT", None
@@ -595,19 +1192,33 @@ class CombinedDPLL:
                     model.append(var)
                 else:
                     model.append(-var)
-            return "SAT", model
+            return "SAT", restore_eliminated(model, eliminated, self.assignment)
 
         # Watched literals search
         watched_solver = WatchedLiteralsDPLL(clauses, self.num_vars)
         watched_solver.assignment = self.assignment.copy()
+
+        # Seed saved phases: preprocessor-assigned polarities plus any
+        # phases cached from a previous solve
+        for var, value in self.assignment.items():
+            self.phase_cache[var] = value
+        for var, value in self.phase_cache.items():
+            watched_solver.phase[var] = 1 if value else 0
+
         status, model = watched_solver.solve()
 
+        # Keep the cache up to date with the search's saved phases
+        for var in range(1, self.num_vars + 1):
+            self.phase_cache[var] = bool(watched_solver.phase[var])
+
         # Merge metrics
         self.metrics.decisions = watched_solver.metrics.decisions
         self.metrics.backtracks = watched_solver.metrics.backtracks
         self.metrics.unit_propagations += watched_solver.metrics.unit_propagations
         self.metrics.conflicts = watched_solver.metrics.conflicts
 
+        if status == "SAT":
+            model = restore_eliminated(model, eliminated, self.assignment)
         return status, model
 
 
